@@ -1,8 +1,16 @@
 import tkinter as tk
-from tkinter import ttk, messagebox
-import time, threading, math, ctypes
+from tkinter import ttk, messagebox, font as tkfont
+import os, sys, threading, math, ctypes, queue
 from datetime import datetime
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))  # For timer/core
+from core.clock import hand_angles
+from core.countdown import CountdownEngine
+
+CLOCK_FPS = 30  # Hand updates per second; the second hand sweeps smoothly at this rate
+UI_POLL_MS = 50  # How often the Tk loop drains messages while a timer thread runs
+RESIZE_DELAY_MS = 16  # <Configure> events within one frame collapse into a single relayout
+
 class TimerApp:
     def __init__(self, root):
         self.root = root
@@ -10,9 +18,17 @@ class TimerApp:
         self.root.minsize(800, 600)
         self.root.resizable(True, True)
         self.root.tk.call('tk', 'scaling', 1.0)  # Set DPI scaling to 100%
-        self.running = False
-        self.time_left = 0
+        self.countdown = CountdownEngine()  # Read by the timer thread, changed only on the Tk thread
+        self.stop_event = threading.Event()
+        self.worker = None  # The latest timer thread
+        self.ui_queue = queue.SimpleQueue()  # (stop_event, message, seconds) from the timer thread
+        self.ui_poll_job = None
         self.fonts = {}
+        self.font_cache = {}  # (family, size, weight) -> tkfont.Font, one per size bucket
+        self.widget_fonts = {}  # Widget name -> font spec it was last configured with
+        self.button_style_options = None
+        self.resize_job = None
+        self.pending_height = None
         self.button_style = ttk.Style()
 
         self._configure_window()
@@ -26,6 +42,7 @@ class TimerApp:
 
         self.update_fonts_and_buttons()
         self.update_clock()
+        self.build_analog_clock()
         self.update_analog_clock()
 
     # ---------- Window & Layout ----------
@@ -69,6 +86,8 @@ class TimerApp:
         screen_h = self.root.winfo_screenheight()
         # ~30–35% of the smaller screen dimension, capped at 500px
         self.canvas_size = min(int(min(screen_w, screen_h) * 0.33), 500)
+        self.clock_geometry = None  # (cx, cy, r) the canvas items were built for
+        self.hand_coords = {}  # Last coords given to each hand, to skip unchanged ones
 
     # ---------- UI ----------
     def _build_ui(self):
@@ -128,11 +147,14 @@ class TimerApp:
         else:
             horiz_pad = max(6, min(16, window_h // 80))
             vert_pad  = max(3, min(8, window_h // 160))
-        self.button_style.configure(
-            'TButton',
-            font=self.fonts['med'],
-            padding=(horiz_pad, vert_pad)
-        )
+        button_style_options = (self.fonts['med'], (horiz_pad, vert_pad))
+        if button_style_options != self.button_style_options:  # Restyling makes every button re-layout
+            self.button_style_options = button_style_options
+            self.button_style.configure(
+                'TButton',
+                font=self._font(self.fonts['med']),
+                padding=(horiz_pad, vert_pad)
+            )
 
         # Map widgets to font keys and update them if they exist
         widget_font_map = {
@@ -141,19 +163,41 @@ class TimerApp:
             'timer_label': 'big', 'clock_label': 'med'
         }
         for widget_name, font_key in widget_font_map.items():
-            if hasattr(self, widget_name):
-                getattr(self, widget_name).config(font=self.fonts[font_key])
+            spec = self.fonts[font_key]
+            if hasattr(self, widget_name) and self.widget_fonts.get(widget_name) != spec:
+                self.widget_fonts[widget_name] = spec
+                getattr(self, widget_name).config(font=self._font(spec))
+
+    def _font(self, spec):
+        """Shared Font object for a (family, size[, weight]) spec, created on first use."""
+        font = self.font_cache.get(spec)
+        if font is None:
+            family, size, *weight = spec
+            font = tkfont.Font(root=self.root, family=family, size=size, weight=weight[0] if weight else "normal")
+            self.font_cache[spec] = font
+        return font
 
     def on_resize(self, event):
-        max_w, max_h = self.root.winfo_screenwidth(), self.root.winfo_screenheight()
-        w = max(800, min(event.width, max_w))
-        h = max(600, min(event.height, max_h))
+        if event.widget is not self.root:
+            return  # Every child's <Configure> also reaches the root binding
+        self.pending_height = event.height
+        if self.resize_job is None:
+            self.resize_job = self.root.after(RESIZE_DELAY_MS, self._relayout)
+
+    def _relayout(self):
+        """One relayout for all the <Configure> events of the last frame."""
+        self.resize_job = None
+        max_h = self.root.winfo_screenheight()
+        h = max(600, min(self.pending_height, max_h))
 
         self.update_fonts_and_buttons()
         scale_factor = 0.55
         max_size = 900 if self.fullscreen else 600
-        self.canvas_size = min(h * scale_factor, max_size)
-        self.clock_canvas.config(width=self.canvas_size, height=self.canvas_size)
+        canvas_size = min(h * scale_factor, max_size)
+        if canvas_size != self.canvas_size:
+            self.canvas_size = canvas_size
+            self.clock_canvas.config(width=self.canvas_size, height=self.canvas_size)
+            self.build_analog_clock()
 
     def toggle_fullscreen(self, event=None):
         self.fullscreen = not self.fullscreen
@@ -171,13 +215,18 @@ class TimerApp:
             h, m, s = 0, 0, 0
         self.timer_label.config(text=f"{h:02d}:{m:02d}:{s:02d}")
 
-    def update_analog_clock(self):
-        self.clock_canvas.delete("all")
+    def build_analog_clock(self):
+        """Create the dial and hands once; only a change of canvas size rebuilds them."""
         cx = cy = self.canvas_size // 2
         r = int(self.canvas_size * 0.40)
+        if self.clock_geometry == (cx, cy, r):
+            return
+        self.clock_geometry = (cx, cy, r)
+        self.hand_coords.clear()
+        self.clock_canvas.delete("all")
 
         # Face
-        self.clock_canvas.create_oval(cx - r, cy - r, cx + r, cy + r, fill="#f8f8f8", outline="#333", width=3)
+        self.clock_canvas.create_oval(cx - r, cy - r, cx + r, cy + r, fill="#f8f8f8", outline="#333", width=3, tags="dial")
 
         # Hour marks
         for i in range(12):
@@ -186,7 +235,7 @@ class TimerApp:
             y1 = cy - (r - 10) * math.cos(angle)
             x2 = cx + r * math.sin(angle)
             y2 = cy - r * math.cos(angle)
-            self.clock_canvas.create_line(x1, y1, x2, y2, fill="#333", width=3)
+            self.clock_canvas.create_line(x1, y1, x2, y2, fill="#333", width=3, tags="dial")
 
         # Numbers
         for num, angle in zip([12, 3, 6, 9], [0, 90, 180, 270]):
@@ -195,85 +244,118 @@ class TimerApp:
             ny = cy - (r - 30) * math.cos(rad)
             self.clock_canvas.create_text(nx, ny, text=str(num),
                                           font=("Segoe UI", max(10, int(r*0.18)), "bold"),
-                                          fill="#222")
-
-        now = datetime.now()
-        hour = now.hour % 12
-        minute = now.minute
-        second = now.second + now.microsecond / 1_000_000
-
-        # Hour hand — shortened for better proportions
-        hour_angle = (hour + minute / 60) * 30
-        hx = cx + (r - 50) * math.sin(math.radians(hour_angle))
-        hy = cy - (r - 50) * math.cos(math.radians(hour_angle))
-        self.clock_canvas.create_line(cx, cy, hx, hy, fill="#222", width=8,
-                                      capstyle=tk.ROUND, smooth=True)
-
-        # Minute hand
-        min_angle = (minute + second / 60) * 6
-        mx = cx + (r - 15) * math.sin(math.radians(min_angle))
-        my = cy - (r - 15) * math.cos(math.radians(min_angle))
-        self.clock_canvas.create_line(cx, cy, mx, my, fill="#444", width=4,
-                                      capstyle=tk.ROUND, smooth=True)
-
-        # Second hand
-        sec_angle = second * 6
-        sx = cx + (r - 5) * math.sin(math.radians(sec_angle))
-        sy = cy - (r - 5) * math.cos(math.radians(sec_angle))
-        self.clock_canvas.create_line(cx, cy, sx, sy, fill="#e33", width=2,
-                                      capstyle=tk.ROUND, smooth=True)
-
-        # Center hub
-        self.clock_canvas.create_oval(cx - 5, cy - 5, cx + 5, cy + 5, fill="#222")
-
-        self.root.after(1, self.update_analog_clock)
+                                          fill="#222", tags="dial")
+
+        # Hands start folded onto the centre; update_analog_clock moves them
+        self.clock_canvas.create_line(cx, cy, cx, cy, fill="#222", width=8,
+                                      capstyle=tk.ROUND, tags="hour_hand")
+        self.clock_canvas.create_line(cx, cy, cx, cy, fill="#444", width=4,
+                                      capstyle=tk.ROUND, tags="minute_hand")
+        self.clock_canvas.create_line(cx, cy, cx, cy, fill="#e33", width=2,
+                                      capstyle=tk.ROUND, tags="second_hand")
+
+        # Center hub, above the hands
+        self.clock_canvas.create_oval(cx - 5, cy - 5, cx + 5, cy + 5, fill="#222", tags="dial")
+        self.update_hands()
+
+    def update_analog_clock(self):
+        self.update_hands()
+        self.root.after(1000 // CLOCK_FPS, self.update_analog_clock)
+
+    def update_hands(self):
+        """Move the three hand items with coords(); nothing is created or deleted."""
+        angles = hand_angles()
+        _, _, r = self.clock_geometry
+        self._move_hand("hour_hand", angles["hour"], r - 50)  # Shortened for better proportions
+        self._move_hand("minute_hand", angles["minute"], r - 15)
+        self._move_hand("second_hand", angles["second"], r - 5)
+
+    def _move_hand(self, tag, angle, length):
+        cx, cy, _ = self.clock_geometry
+        rad = math.radians(angle)
+        coords = (cx, cy, round(cx + length * math.sin(rad)), round(cy - length * math.cos(rad)))
+        if self.hand_coords.get(tag) != coords:  # The hour hand rarely moves a whole pixel
+            self.hand_coords[tag] = coords
+            self.clock_canvas.coords(tag, *coords)
 
     # ---------- Timer Controls ----------
     def start_timer(self):
-        if not self.running:
+        if not self.countdown.running:
             self._toggle_spinboxes("disabled")
-            try:
-                if self.time_left == 0:
+            if self.countdown.paused:
+                self.countdown.resume()
+            else:
+                try:
                     h, m, s = int(self.hour_var.get()), int(self.min_var.get()), int(self.sec_var.get())
-                    self.time_left = h * 3600 + m * 60 + s
-            except ValueError:
-                self.timer_label.config(text="Invalid")
-                self._toggle_spinboxes("normal")
-                return
+                except ValueError:
+                    self.timer_label.config(text="Invalid")
+                    self._toggle_spinboxes("normal")
+                    return
 
-            if self.time_left <= 0:
-                self.timer_label.config(text="00:00:00")
-                messagebox.showinfo("Timer", "Time is up.")
-                self._toggle_spinboxes("normal")
+                duration_secs = h * 3600 + m * 60 + s
+                if duration_secs <= 0:
+                    self.timer_label.config(text="00:00:00")
+                    messagebox.showinfo("Timer", "Time is up.")
+                    self._toggle_spinboxes("normal")
+                    return
+                self.countdown.start(duration_secs * 1000)
+
+            self.stop_event = threading.Event()  # A fresh one per run, so a late stale thread cannot resume
+            self.worker = threading.Thread(target=self._run_timer, args=(self.stop_event,), daemon=True)
+            self.worker.start()
+            if self.ui_poll_job is None:
+                self.drain_ui_queue()
+
+    def _run_timer(self, stop_event):
+        """Timer thread: posts whole seconds left to ui_queue; never touches Tk itself."""
+        while not stop_event.is_set():
+            seconds = self.countdown.remaining_secs()
+            if seconds == 0:
+                self.ui_queue.put((stop_event, "done", 0))
                 return
+            self.ui_queue.put((stop_event, "tick", seconds))
+            # Sleep to the next whole-second boundary of the deadline, not a fixed 1 s
+            stop_event.wait(self.countdown.ms_until_next_change() / 1000)
+
+    def drain_ui_queue(self):
+        """Apply timer thread messages on the Tk thread; polls only while a timer thread runs."""
+        self.ui_poll_job = None
+        while True:
+            try:
+                stop_event, message, seconds = self.ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            if stop_event is not self.stop_event or stop_event.is_set():
+                continue  # From a run that has since been stopped or reset
+            self._show_time_left(seconds)
+            if message == "done":
+                stop_event.set()
+                self.countdown.reset()
+                self._toggle_spinboxes("normal")
+                messagebox.showinfo("Timer", "Time is up.")
+        # A thread puts its last message before it exits, so once it is gone an empty queue stays empty
+        if self.ui_poll_job is None and (self.worker.is_alive() or not self.ui_queue.empty()):
+            self.ui_poll_job = self.root.after(UI_POLL_MS, self.drain_ui_queue)
 
-            self.running = True
-            threading.Thread(target=self._run_timer, daemon=True).start()
-
-    def _run_timer(self):
-        while self.time_left > 0 and self.running:
-            h, rem = divmod(self.time_left, 3600)
-            m, s = divmod(rem, 60)
-            self.timer_label.config(text=f"{h:02d}:{m:02d}:{s:02d}")
-            time.sleep(1)
-            self.time_left -= 1
-        if self.time_left == 0:
-            self.timer_label.config(text="00:00:00")
-            messagebox.showinfo("Timer", "Time is up.")
-            self._toggle_spinboxes("normal")
-        self.running = False
+    def _show_time_left(self, seconds):
+        h, rem = divmod(int(seconds), 3600)
+        m, s = divmod(rem, 60)
+        self.timer_label.config(text=f"{h:02d}:{m:02d}:{s:02d}")
 
     def stop_timer(self):
-        self.running = False
+        if self.countdown.expired():
+            return  # Too late to pause: let the timer thread's "done" finish it
+        self.stop_event.set()
+        self.countdown.pause()  # Keeps the partial second for the next start
 
     def reset_timer(self):
-        self.running = False
+        self.stop_event.set()
+        self.countdown.reset()
         self.hour_var.set("0")
         self.min_var.set("0")
         self.sec_var.set("0")
         self._toggle_spinboxes("normal")
         self.timer_label.config(text="00:00:00")
-        self.time_left = 0
 
     def _toggle_spinboxes(self, state):
         self.hour_spin.config(state=state)
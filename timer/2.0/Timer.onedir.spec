@@ -0,0 +1,89 @@
+# -*- mode: python ; coding: utf-8 -*-
+# One-dir build tuned for startup:  pyinstaller --clean Timer.onedir.spec
+#
+# Timer.spec packs everything into one exe that unpacks itself to a new temp
+# folder on every launch. This build installs dist/Timer/ already unpacked,
+# leaves out the Qt modules, plugins and translations the app never loads,
+# skips UPX (DLLs would be decompressed on each load) and ships -OO bytecode.
+
+import os
+
+# Qt modules the app does not import; their hooks would pull in DLLs and plugins
+QT_EXCLUDES = [
+    'PySide6.' + name for name in (
+        'Qt3DAnimation', 'Qt3DCore', 'Qt3DExtras', 'Qt3DInput', 'Qt3DLogic', 'Qt3DRender',
+        'QtBluetooth', 'QtCharts', 'QtConcurrent', 'QtDataVisualization', 'QtDBus', 'QtDesigner',
+        'QtGraphs', 'QtHelp', 'QtHttpServer', 'QtLocation', 'QtMultimedia', 'QtMultimediaWidgets',
+        'QtNetwork', 'QtNetworkAuth', 'QtNfc', 'QtPdf', 'QtPdfWidgets', 'QtPositioning',
+        'QtPrintSupport', 'QtQml', 'QtQuick', 'QtQuick3D', 'QtQuickControls2', 'QtQuickWidgets',
+        'QtRemoteObjects', 'QtScxml', 'QtSensors', 'QtSerialBus', 'QtSerialPort', 'QtSpatialAudio',
+        'QtSql', 'QtStateMachine', 'QtSvg', 'QtSvgWidgets', 'QtTest', 'QtTextToSpeech', 'QtUiTools',
+        'QtWebChannel', 'QtWebEngineCore', 'QtWebEngineQuick', 'QtWebEngineWidgets', 'QtWebSockets',
+        'QtXml',
+    )
+]
+STDLIB_EXCLUDES = ['tkinter', 'unittest', 'pydoc', 'doctest', 'pdb', 'xmlrpc', 'sqlite3']
+
+# Plugin folders Qt needs for a widgets app on Windows; .ico decoding is the only image plugin used
+KEEP_PLUGIN_DIRS = {'platforms', 'styles', 'imageformats'}
+KEEP_IMAGE_PLUGINS = ('qico',)
+
+
+def needed(entry):
+    parts = entry[0].replace('\\', '/').split('/')
+    if 'translations' in parts:
+        return False  # The UI is English only and installs no QTranslator
+    if 'plugins' in parts and len(parts) > parts.index('plugins') + 2:
+        folder = parts[parts.index('plugins') + 1]
+        if folder not in KEEP_PLUGIN_DIRS:
+            return False
+        if folder == 'imageformats':
+            return parts[-1].startswith(KEEP_IMAGE_PLUGINS)
+    return True
+
+
+a = Analysis(
+    ['Timer.py'],
+    pathex=[os.path.join(SPECPATH, '..')],  # The shared timer/core package
+    binaries=[],
+    datas=[('setting.png', '.'), ('stopwatch.png', '.'), ('3158183.png', '.'), ('app_icon.ico', '.'), ('3158183.ico', '.')],
+    hiddenimports=[],
+    hookspath=[],
+    hooksconfig={},
+    runtime_hooks=[],
+    excludes=QT_EXCLUDES + STDLIB_EXCLUDES,
+    noarchive=False,
+    optimize=2,
+)
+a.binaries = [entry for entry in a.binaries if needed(entry)]
+a.datas = [entry for entry in a.datas if needed(entry)]
+pyz = PYZ(a.pure)
+
+exe = EXE(
+    pyz,
+    a.scripts,
+    [],
+    exclude_binaries=True,
+    name='Timer',
+    debug=False,
+    bootloader_ignore_signals=False,
+    strip=False,
+    upx=False,
+    console=False,
+    disable_windowed_traceback=False,
+    argv_emulation=False,
+    target_arch=None,
+    codesign_identity=None,
+    entitlements_file=None,
+    version='dis.txt',
+    icon=['app_icon.ico'],
+)
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.datas,
+    strip=False,
+    upx=False,
+    upx_exclude=[],
+    name='Timer',
+)
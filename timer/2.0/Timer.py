@@ -1,15 +1,47 @@
 # timer_by_pyside.py
 # A countdown timer app with analog clock and dynamic, theme-based backgrounds, and Stopwatch
+import time
+STARTUP_T0 = time.perf_counter()  # Taken first so startup numbers include imports
 import sys
+from startup_profile import from_argv as startup_profile_from_argv
+STARTUP_PROFILE = startup_profile_from_argv(sys.argv, STARTUP_T0)  # None unless --profile-startup
+if STARTUP_PROFILE:
+    STARTUP_PROFILE.install()
+
 import os
 import datetime
+from functools import lru_cache
+from zoneinfo import ZoneInfo, available_timezones, ZoneInfoNotFoundError
 from math import sin, cos, radians
+from collections import deque
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QLabel, QPushButton, QSpinBox, QVBoxLayout, QCheckBox,
-    QHBoxLayout, QGridLayout, QMessageBox, QStackedWidget, QSpacerItem, QSizePolicy, QTextEdit
+    QHBoxLayout, QGridLayout, QMessageBox, QStackedWidget, QSpacerItem, QSizePolicy,
+    QLineEdit, QTimeEdit, QListView, QTableView, QHeaderView, QAbstractItemView, QStyle, QComboBox, QCompleter
+)
+from PySide6.QtCore import (
+    QEvent, QObject, QTimer, QTime, Qt, QSize, QElapsedTimer, QAbstractListModel, QModelIndex, QPoint,
+    QStandardPaths, QRectF, QPointF, QLineF, QTimeZone, QLockFile
 )
-from PySide6.QtCore import QTimer, QTime, Qt, QSize, QElapsedTimer
-from PySide6.QtGui import QPainter, QPen, QColor, QIcon
+from PySide6.QtGui import (
+    QGuiApplication, QPainter, QPen, QColor, QIcon, QPixmap, QPalette, QRegion, QTransform, QOpenGLContext,
+    QPainterPath
+)
+try:
+    from PySide6.QtOpenGLWidgets import QOpenGLWidget
+except ImportError:  # Not shipped in every build; the clock then stays on the raster renderer
+    QOpenGLWidget = None
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))  # For timer/core
+from core.clock import NS_PER_MS, hand_angles
+from core.countdown import CountdownEngine
+from core.laps import LapRecorder
+from core.stopwatch import StopwatchEngine
+from multitimer import MultiTimerEngine
+from worldclock import WorldClock
+from timefmt import TimeLabel, format_hms, format_ms, format_time_of_day
+from lapexport import LapExporter, EXTENSIONS as LAP_EXPORT_EXTENSIONS
+from journal import SessionJournal, anchors, elapsed_since
+from assets import asset_icon, asset_path
 
 def get_dark_style():
     return """ 
@@ -61,7 +93,7 @@ def get_dark_style():
             QCheckBox::indicator:unchecked {
                 /* Leave this empty or minimal */
             }
-            QTextEdit {
+            QListView, QTableView {
                 background-color: #2E2E2E;
                 color: white;
             }
@@ -119,29 +151,281 @@ def get_light_style():
                 background-color: white;
                 border: 1px solid #666666;
             }
-            QTextEdit {
+            QListView, QTableView {
                 background-color: #F0F0F0;
                 color: black;
             }
         """
 
+# Round icon buttons (settings, stopwatch, ...) are matched by object name, so the
+# whole theme lives in one style sheet applied once at the top of the widget tree
+ICON_BUTTON_STYLE = """
+            QPushButton#iconButton {{
+                background-color: {background};
+                border-radius: 15px;
+                border: 1px solid #565859;
+            }}
+            QPushButton#iconButton:hover {{ background-color: {hover}; }}
+            QPushButton#iconButton:pressed {{
+                background-color: #202020;
+                border: 1px solid #2e2e2e;
+            }}
+        """
+
+# theme: (base style, icon background, icon hover, window colour)
+THEMES = {
+    "default": (None, "#404040", "#999999", None),
+    "dark": (get_dark_style, "#1E1E1E", "#666666", "#1E1E1E"),
+    "light": (get_light_style, "transparent", "#999999", "white"),
+}
+
+
+@lru_cache(maxsize=None)
+def get_theme_style(theme):
+    """Complete style sheet for ``theme``, built once and reused on every switch."""
+    base_style, icon_background, icon_hover, _ = THEMES[theme]
+    icon_style = ICON_BUTTON_STYLE.format(background=icon_background, hover=icon_hover)
+    return (base_style() if base_style else "") + icon_style
+
+
+@lru_cache(maxsize=None)
+def get_theme_palette(theme):
+    """Palette for the top-level window, whose margins the style sheet does not reach."""
+    palette = QPalette(QApplication.palette())
+    window_color = THEMES[theme][3]
+    if window_color:
+        palette.setColor(QPalette.Window, QColor(window_color))
+    return palette
+
+
+def clock_label_text(timestamp):
+    return "Time: " + format_time_of_day(timestamp)
+
+
+def make_icon_button(icon):
+    button = QPushButton()
+    button.setObjectName("iconButton")
+    button.setIcon(icon)
+    button.setIconSize(QSize(32, 32))
+    button.setFixedSize(50, 50)
+    return button
+
+
+# ---------- Frame Scheduler ----------
+class Subscription:
+    __slots__ = ("callback", "rate", "owner", "active", "visible", "shown", "blocked_since")
+
+    def __init__(self, callback, rate, owner, active):
+        self.callback = callback
+        self.rate = rate
+        self.owner = owner
+        self.active = active      # Wanted by the subscriber (e.g. stopwatch running)
+        self.visible = True       # Owner is on screen: shown, not minimised, exposed
+        self.shown = owner is None  # Owner has been on screen at least once
+        self.blocked_since = None  # monotonic ns when ticks started being withheld
+
+    def wants_ticks(self):
+        return self.active and self.visible
+
+
+class FrameScheduler(QObject):
+    """One shared tick source for every animated widget.
+
+    Subscribers ask for either SECOND ticks, lined up with the wall-clock
+    second edge (digital labels), or FRAME ticks at the display refresh rate
+    (smooth hands, running stopwatch). Each rate is driven by a single QTimer
+    that only runs while at least one subscriber of that rate wants ticks.
+
+    A subscriber with an owner widget is paused while that widget is hidden,
+    its window is minimised or the window is not exposed (fully obscured),
+    and caught up as soon as it is back on screen. Frames withheld in the
+    meantime are counted in ``skipped_frames`` (shown in Settings); time
+    before an owner is first shown, such as startup, does not count.
+    """
+    SECOND = "second"
+    FRAME = "frame"
+
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = cls(QApplication.instance())
+        return cls._instance
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._subscribers = {self.SECOND: [], self.FRAME: []}
+        self._visibility_pending = False
+        self.skipped_frames = 0
+
+        self._frame_timer = QTimer(self)
+        self._frame_timer.setTimerType(Qt.PreciseTimer)
+        self._frame_timer.timeout.connect(self._on_frame)
+
+        # Re-armed after every tick so it keeps landing on the second edge
+        self._second_timer = QTimer(self)
+        self._second_timer.setSingleShot(True)
+        self._second_timer.setTimerType(Qt.PreciseTimer)
+        self._second_timer.timeout.connect(self._on_second)
+
+    def subscribe(self, callback, rate=FRAME, owner=None, active=True):
+        sub = Subscription(callback, rate, owner, active)
+        if owner is not None:
+            owner.installEventFilter(self)
+            owner.destroyed.connect(lambda *args, sub=sub: self._forget(sub))
+            sub.visible = sub.shown = self._is_on_screen(owner)
+            self._track_blocked(sub)
+        self._subscribers[rate].append(sub)
+        self._sync_timers()
+        return sub
+
+    def unsubscribe(self, sub):
+        self._subscribers[sub.rate].remove(sub)
+        self._sync_timers()
+
+    def _forget(self, sub):
+        if sub in self._subscribers[sub.rate]:
+            self.unsubscribe(sub)
+
+    def pause(self, sub):
+        if sub.active:
+            self._set_state(sub, active=False)
+            self._sync_timers()
+
+    def resume(self, sub):
+        if not sub.active:
+            self._set_state(sub, active=True)
+            self._sync_timers()
+
+    def frame_interval(self):
+        """Milliseconds per frame at the primary screen's refresh rate."""
+        screen = QGuiApplication.primaryScreen()
+        rate = screen.refreshRate() if screen else 0
+        return max(1, round(1000 / (rate or 60)))
+
+    # ---------- Visibility ----------
+    def eventFilter(self, obj, event):
+        etype = event.type()
+        if etype == QEvent.Show and obj.isWidgetType():
+            # The top-level window (and its QWindow) only exist once shown
+            window = obj.window()
+            window.installEventFilter(self)
+            if window.windowHandle() is not None:
+                window.windowHandle().installEventFilter(self)
+        if etype in (QEvent.Show, QEvent.Hide, QEvent.WindowStateChange, QEvent.Expose):
+            self._schedule_visibility_check()
+        return False
+
+    def _schedule_visibility_check(self):
+        # Show/hide of a page arrives as a burst of events; handle it once
+        if not self._visibility_pending:
+            self._visibility_pending = True
+            QTimer.singleShot(0, self._update_visibility)
+
+    @staticmethod
+    def _is_on_screen(owner):
+        if not owner.isVisible():
+            return False
+        window = owner.window()
+        if window.isMinimized():
+            return False
+        handle = window.windowHandle()
+        return handle is None or handle.isExposed()
+
+    def _update_visibility(self):
+        self._visibility_pending = False
+        for subs in self._subscribers.values():
+            for sub in subs:
+                if sub.owner is not None:
+                    self._set_state(sub, visible=self._is_on_screen(sub.owner))
+        self._sync_timers()
+
+    def _set_state(self, sub, active=None, visible=None):
+        was_ticking = sub.wants_ticks()
+        if active is not None:
+            sub.active = active
+        if visible is not None:
+            sub.visible = visible
+            sub.shown = sub.shown or visible
+        self._track_blocked(sub)
+        if sub.wants_ticks() and not was_ticking:
+            sub.callback()  # Catch up immediately instead of waiting a tick
+
+    def _track_blocked(self, sub):
+        # Frames are only "skipped" while the subscriber wants them but is off screen
+        blocked = sub.active and not sub.visible and sub.shown
+        if blocked and sub.blocked_since is None:
+            sub.blocked_since = time.monotonic_ns()
+        elif not blocked and sub.blocked_since is not None:
+            interval_ms = self.frame_interval() if sub.rate == self.FRAME else 1000
+            self.skipped_frames += (time.monotonic_ns() - sub.blocked_since) // (interval_ms * 1_000_000)
+            sub.blocked_since = None
+
+    # ---------- Ticking ----------
+    def _has_ticking(self, rate):
+        return any(sub.wants_ticks() for sub in self._subscribers[rate])
+
+    def _sync_timers(self):
+        if self._has_ticking(self.FRAME):
+            interval = self.frame_interval()
+            if not self._frame_timer.isActive() or self._frame_timer.interval() != interval:
+                self._frame_timer.start(interval)
+        else:
+            self._frame_timer.stop()
+
+        if self._has_ticking(self.SECOND):
+            if not self._second_timer.isActive():
+                self._arm_second_timer()
+        else:
+            self._second_timer.stop()
+
+    def _arm_second_timer(self):
+        ms_into_second = (time.time_ns() // 1_000_000) % 1000
+        # Small margin so a slightly early wake-up never shows the old second
+        self._second_timer.start(1000 - ms_into_second + 2)
+
+    def _dispatch(self, rate):
+        for sub in list(self._subscribers[rate]):
+            if sub.wants_ticks():
+                sub.callback()
+
+    def _on_frame(self):
+        self._dispatch(self.FRAME)
+
+    def _on_second(self):
+        self._dispatch(self.SECOND)
+        if self._has_ticking(self.SECOND):
+            self._arm_second_timer()
+
 
 class CountdownTimer(QWidget):
     def __init__(self):
+        build_start = time.perf_counter()
         super().__init__()
         self.is_paused = False
+        self.journal = None
+        self.countdown = CountdownEngine()
+        # Single-shot, re-armed for the next displayed second (or the deadline)
         self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setTimerType(Qt.PreciseTimer)
         self.timer.timeout.connect(self.update_countdown)
 
-        # Pages
+        self.lap_export_format = None
+        self.painted = False
+
+        # Pages: only the main page is built up front, the rest on first visit
         self.stack = QStackedWidget(self)
         self.main_page = QWidget()
-        self.settings_page = Setting(self.stack, self.main_page, self)  # Pass self as timer_widget
-        self.stopwatch_page = Stopwatch(self.stack, self.main_page, self.settings_page)
-
         self.stack.addWidget(self.main_page)
-        self.stack.addWidget(self.stopwatch_page)
-        self.stack.addWidget(self.settings_page)
+        self._pages = {}
+        self._page_factories = {
+            "settings": lambda: Setting(self.stack, self.main_page, self),  # Pass self as timer_widget
+            "stopwatch": self._build_stopwatch,
+            "timers": lambda: MultiTimerPage(self.stack, self.main_page),
+            "world": lambda: WorldClockPage(self.stack, self.main_page),
+        }
 
         self._create_widgets()
         self._create_main_layout()
@@ -151,11 +435,18 @@ class CountdownTimer(QWidget):
         layout.addWidget(self.stack)
         self.stack.setCurrentWidget(self.main_page)
 
+        self.theme = None
+        self.apply_theme("default")
+        if STARTUP_PROFILE:
+            STARTUP_PROFILE.page_built("main", (time.perf_counter() - build_start) * 1000)
+
     # ---------- UI Construction ----------
     def _create_widgets(self):
-        self.display = QLabel("00:00:00")
+        self.display = QLabel()
         self.display.setStyleSheet("font-size: 48px; font-weight: bold; background: transparent;")
         self.display.setAlignment(Qt.AlignCenter)
+        self.display_text = TimeLabel(self.display, format_hms)
+        self.display_text.show(0)
 
         self.h_spin = QSpinBox(); self.h_spin.setRange(0, 23)
         self.m_spin = QSpinBox(); self.m_spin.setRange(0, 59)
@@ -166,48 +457,23 @@ class CountdownTimer(QWidget):
         self.reset_btn = QPushButton("Reset")
 
         # Settings icon button
-        self.setting_btn = QPushButton()
-        setting_icon_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), "setting.png")
-        self.setting_btn.setIcon(QIcon(setting_icon_file))
-        self.setting_btn.setIconSize(QSize(32, 32))
-        self.setting_btn.setFixedSize(50, 50)
-        self.setting_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #404040;
-                border-radius: 15px;
-                border: 1px solid #565859;
-            }
-            QPushButton:hover { background-color: #999999; }
-            QPushButton:pressed {
-                background-color: #202020;
-                border: 1px solid #2e2e2e;
-            }
-        """)
+        self.setting_btn = make_icon_button(asset_icon("setting.png"))
         # Stop Watch icon button
-        self.stopwatch_btn = QPushButton()
-        stopwatch_icon_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), "stopwatch.png")
-        self.stopwatch_btn.setIcon(QIcon(stopwatch_icon_file))
-        self.stopwatch_btn.setIconSize(QSize(32, 32))
-        self.stopwatch_btn.setFixedSize(50, 50)
-        self.stopwatch_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #404040;
-                border-radius: 15px;
-                border: 1px solid #565859;
-            }
-            QPushButton:hover { background-color: #999999; }
-            QPushButton:pressed {
-                background-color: #202020;
-                border: 1px solid #2e2e2e;
-            }
-        """)
+        self.stopwatch_btn = make_icon_button(asset_icon("stopwatch.png"))
 
         self.clock_display = QLabel()
         self.clock_display.setStyleSheet("font-size: 24px; color: gray; background: transparent;")
         self.clock_display.setAlignment(Qt.AlignCenter)
+        self.clock_text = TimeLabel(self.clock_display, clock_label_text)
         self._update_clock()
+        FrameScheduler.instance().subscribe(self._update_clock, FrameScheduler.SECOND, owner=self.clock_display)
+
+        self.analog_clock = make_clock("raster")
 
-        self.analog_clock = AnalogClock()
+        # Multiple timers list button
+        self.timers_btn = make_icon_button(self.style().standardIcon(QStyle.SP_FileDialogListView))
+        # World clock button
+        self.world_btn = make_icon_button(self.style().standardIcon(QStyle.SP_DriveNetIcon))
 
     def _create_main_layout(self):
         grid = QGridLayout()
@@ -230,6 +496,8 @@ class CountdownTimer(QWidget):
         # Bottom-right settings button
         bottom_row = QHBoxLayout()
         bottom_row.addItem(QSpacerItem(0, 0, QSizePolicy.Expanding, QSizePolicy.Minimum))
+        bottom_row.addWidget(self.world_btn)
+        bottom_row.addWidget(self.timers_btn)
         bottom_row.addWidget(self.stopwatch_btn)
         bottom_row.addWidget(self.setting_btn)
         layout.addStretch()
@@ -240,135 +508,375 @@ class CountdownTimer(QWidget):
         self.pause_btn.clicked.connect(self.pause_timer)
         self.reset_btn.clicked.connect(self.reset_timer)
         self.setting_btn.clicked.connect(lambda: self.show_settings_from(self.main_page))
-        self.stopwatch_btn.clicked.connect(lambda: self.stack.setCurrentWidget(self.stopwatch_page))
+        self.stopwatch_btn.clicked.connect(lambda: self.show_page("stopwatch"))
+        self.timers_btn.clicked.connect(lambda: self.show_page("timers"))
+        self.world_btn.clicked.connect(lambda: self.show_page("world"))
+
+    # ---------- Pages ----------
+    def page(self, name):
+        """Return page ``name``, building it and adding it to the stack on first use."""
+        page = self._pages.get(name)
+        if page is None:
+            build_start = time.perf_counter()
+            page = self._pages[name] = self._page_factories[name]()
+            self.stack.addWidget(page)
+            if STARTUP_PROFILE:
+                STARTUP_PROFILE.page_built(name, (time.perf_counter() - build_start) * 1000)
+        return page
+
+    def show_page(self, name):
+        self.stack.setCurrentWidget(self.page(name))
+
+    def _build_stopwatch(self):
+        stopwatch = Stopwatch(self.stack, self.main_page, self)
+        stopwatch.journal = self.journal
+        stopwatch.export_format = self.lap_export_format
+        return stopwatch
+
+    @property
+    def settings_page(self):
+        return self.page("settings")
+
+    @property
+    def stopwatch_page(self):
+        return self.page("stopwatch")
+
+    @property
+    def multi_timer_page(self):
+        return self.page("timers")
+
+    def set_lap_export(self, fmt):
+        self.lap_export_format = fmt
+        if "stopwatch" in self._pages:
+            self._pages["stopwatch"].set_export_format(fmt)  # Can turn export back off on failure
+        if "settings" in self._pages:
+            export_cb = self._pages["settings"].ExportCB
+            export_cb.blockSignals(True)
+            export_cb.setCurrentIndex(export_cb.findData(self.lap_export_format))
+            export_cb.blockSignals(False)
+
+    def set_clock_renderer(self, renderer):
+        """Swap the analog clock to ``renderer`` and return the renderer actually in use."""
+        if renderer == "opengl" and not opengl_available():
+            renderer = "raster"
+        if renderer == self.analog_clock.renderer:
+            return renderer  # Nothing to build: a discarded clock would stay subscribed
+        old = self.analog_clock
+        self.analog_clock = make_clock(renderer, old.dial_style)
+        self.main_page.layout().replaceWidget(old, self.analog_clock)
+        old.hide()
+        old.deleteLater()
+        return renderer
+
+    # ---------- Startup ----------
+    def paintEvent(self, event):
+        if not self.painted:
+            self.painted = True
+            if STARTUP_PROFILE:
+                within_budget = STARTUP_PROFILE.first_paint()
+                if STARTUP_PROFILE.budget_ms is not None:
+                    # Budget runs are checks, not sessions: leave once the window is up
+                    QTimer.singleShot(0, lambda: QApplication.exit(0 if within_budget else 1))
+        super().paintEvent(event)
 
 
     # ---------- Core Functionality ----------
     def start_timer(self):
         if self.is_paused:
-            self.timer.start(1000)
+            self.is_paused = False
+            self.countdown.resume()
+            if not self.countdown.running:  # Nothing left to resume
+                self._finish()
+                return
+            self._record("start", remaining_ms=self.countdown.remaining_ms(), anchor=anchors())
+            self._arm_timer()
             self.start_btn.setEnabled(False)
             self.pause_btn.setEnabled(True)
-            self.is_paused = False
             return
 
         self.pause_btn.setEnabled(True)
-        self.remaining_secs = (
+        total_secs = (
             self.h_spin.value() * 3600 +
             self.m_spin.value() * 60 +
             self.s_spin.value()
         )
-        if self.remaining_secs > 0:
+        if total_secs > 0:
+            self.countdown.start(total_secs * 1000)
+            self._record("start", remaining_ms=self.countdown.remaining_ms(), anchor=anchors())
             self.update_display()
-            self.timer.start(1000)
+            self._arm_timer()
             self.start_btn.setEnabled(False)
         else:
             self.pause_btn.setEnabled(False)
             QMessageBox.warning(self, "Warning", "Set a time before starting.")
 
     def pause_timer(self):
-        if self.timer.isActive():
+        if self.countdown.expired():
+            # Pause handled after the deadline but before the expiry tick: finish now
             self.timer.stop()
+            self.update_countdown()
+        elif self.countdown.running:
+            self.countdown.pause()
+            self._record("pause", remaining_ms=self.countdown.remaining_ms())
+            self.timer.stop()
+            self.update_display()
             self.start_btn.setEnabled(True)
             self.start_btn.setText("Continue")
             self.is_paused = True
             self.pause_btn.setEnabled(False)
 
+    def _arm_timer(self):
+        if self.countdown.running:  # A stopped engine reports 0 ms left and would spin
+            self.timer.start(self.countdown.ms_until_next_change())
+
     def update_countdown(self):
-        if self.remaining_secs > 0:
-            self.remaining_secs -= 1
-            self.update_display()
+        # Remaining time comes from the deadline, so a late tick never adds drift
+        self.update_display()
+        if self.countdown.expired():
+            self._finish()
         else:
-            self.timer.stop()
-            self.start_btn.setEnabled(True)
-            self.pause_btn.setEnabled(False)
-            QMessageBox.information(self, "Done", "Countdown finished!")
+            self._arm_timer()
+
+    def _finish(self):
+        self.countdown.reset()
+        self._record("reset")
+        self.update_display()
+        self.start_btn.setEnabled(True)
+        self.start_btn.setText("Start")
+        self.pause_btn.setEnabled(False)
+        QMessageBox.information(self, "Done", "Countdown finished!")
 
     def update_display(self):
-        t = QTime(0, 0).addSecs(self.remaining_secs)
-        self.display.setText(t.toString("hh:mm:ss"))
+        self.display_text.show(self.countdown.remaining_secs())
 
     def reset_timer(self):
         self.timer.stop()
+        self.countdown.reset()
+        self._record("reset")
+        self.is_paused = False
         self.h_spin.setValue(0)
         self.m_spin.setValue(0)
         self.s_spin.setValue(0)
-        self.display.setText("00:00:00")
+        self.display_text.show(0)
         self.start_btn.setEnabled(True)
         self.start_btn.setText("Start")
         self.pause_btn.setEnabled(False)
 
+    # ---------- Session Journal ----------
+    def attach_journal(self, journal):
+        """Restore timers saved in ``journal`` and record every transition from now on."""
+        state = journal.restore()
+        self.journal = journal
+        self._restore_countdown(state["countdown"])
+        if "stopwatch" in self._pages:
+            self._pages["stopwatch"].journal = journal
+        if state["stopwatch"]["state"] != "idle":
+            self.stopwatch_page.restore(state["stopwatch"])  # Only built when there is something to resume
+
+        # Events reach the OS at once; this makes them durable against power loss too
+        self.journal_sync = QTimer(self)
+        self.journal_sync.timeout.connect(journal.sync)
+        self.journal_sync.start(1000)
+        QApplication.instance().aboutToQuit.connect(journal.close)
+
+    def _record(self, event, **fields):
+        if self.journal is not None:
+            self.journal.record("countdown", event, **fields)
+
+    def _restore_countdown(self, saved):
+        if saved["state"] == "idle":
+            return
+        remaining_ms = saved["remaining_ms"]
+        if saved["state"] == "running":
+            remaining_ms -= elapsed_since(saved["anchor"])
+        if remaining_ms <= 0:  # Includes an entry paused on its deadline
+            self._record("reset")
+            QTimer.singleShot(0, lambda: QMessageBox.information(
+                self, "Done", "Countdown finished while the app was closed."))
+            return
+
+        self.countdown.start(remaining_ms)
+        if saved["state"] == "paused":
+            self.countdown.pause()
+            self.is_paused = True
+            self.start_btn.setText("Continue")
+            self.pause_btn.setEnabled(False)
+        else:
+            self.start_btn.setEnabled(False)
+            self.pause_btn.setEnabled(True)
+            self._arm_timer()
+        self.update_display()
+
     def _update_clock(self):
-        current_time = datetime.datetime.now().strftime("%H:%M:%S")
-        self.clock_display.setText(f"Time: {current_time}")
-        QTimer.singleShot(8, self._update_clock)  # Update every second
+        self.clock_text.show(int(time.time()))
 
     def show_settings_from(self, from_page):
         self.settings_page.previous_page = from_page
         self.stack.setCurrentWidget(self.settings_page)
 
+    def apply_theme(self, theme):
+        """Style the whole window for ``theme`` in one pass (no-op if already applied)."""
+        if theme == self.theme:
+            return
+        self.theme = theme
+        self.setStyleSheet(get_theme_style(theme))
+        self.window().setPalette(get_theme_palette(theme))
+        self.analog_clock.invalidate_face()
+
     def apply_light_mode(self):
-        self.setStyleSheet(get_light_style())
-        self.settings_page.setStyleSheet(get_light_style())
-        self.stopwatch_page.setStyleSheet(get_light_style())
-        self.stopwatch_page.apply_light_mode()  # Apply to stopwatch-specific widgets
-        icon_style = """
-            QPushButton {
-                background-color: transparent;
-                border-radius: 15px;
-                border: 1px solid #565859;
-            }
-            QPushButton:hover { background-color: #999999; }
-            QPushButton:pressed {
-                background-color: #202020;
-                border: 1px solid #2e2e2e;
-            }
-        """
-        self.setting_btn.setStyleSheet(icon_style)
-        self.stopwatch_btn.setStyleSheet(icon_style)
+        self.apply_theme("light")
 
     def apply_dark_mode(self):
-        self.setStyleSheet(get_dark_style())
-        self.settings_page.setStyleSheet(get_dark_style())
-        self.stopwatch_page.setStyleSheet(get_dark_style())
-        self.stopwatch_page.apply_dark_mode()  # Apply to stopwatch-specific widgets
-        icon_style = """
-            QPushButton {
-                background-color: #1E1E1E;
-                border-radius: 15px;
-                border: 1px solid #565859;
-            }
-            QPushButton:hover { background-color: #666666; }               
-            QPushButton:pressed {
-                background-color: #202020;
-                border: 1px solid #2e2e2e;
-            }
-        """
-        self.setting_btn.setStyleSheet(icon_style)
-        self.stopwatch_btn.setStyleSheet(icon_style)
+        self.apply_theme("dark")
 
 
 # ---------- Analog Clock ----------
-class AnalogClock(QWidget):
-    def __init__(self):
-        super().__init__()
+# style: (label, numeral radius or None, hour ticks, minute ticks)
+DIAL_STYLES = {
+    "classic": ("Numerals", 75, False, False),
+    "ticks": ("Numerals and ticks", 68, True, True),
+    "minimal": ("Hour ticks", None, True, False),
+}
+
+
+class ClockGeometry:
+    """Everything the clock draws, laid out once per dial style.
+
+    Positions are in dial units (-100..100 across) and the painter's
+    transform scales them to the widget, so one layout serves every size and
+    no trigonometry runs when the face or hands are drawn.
+    """
+
+    def __init__(self, style):
+        _, numeral_radius, hour_ticks, minute_ticks = DIAL_STYLES[style]
+        # Unit vector towards each minute mark, clockwise from 12
+        marks = [QPointF(sin(radians(i * 6)), -cos(radians(i * 6))) for i in range(60)]
+
+        # Text boxes for 1-12, 20 units square and centred on the numeral radius
+        self.numerals = []
+        if numeral_radius:
+            for hour in range(1, 13):
+                centre = marks[hour * 5 % 60] * numeral_radius
+                self.numerals.append((QRectF(int(centre.x() - 10), int(centre.y() - 10), 20, 20), str(hour)))
+        self.hour_ticks = [QLineF(marks[i] * 80, marks[i] * 88) for i in range(0, 60, 5)] if hour_ticks else []
+        self.minute_ticks = [QLineF(marks[i] * 84, marks[i] * 88) for i in range(60) if i % 5] if minute_ticks else []
+
+        # Hands at 12 o'clock, rotated by the painter each frame
+        self.hands = {"hour": QPainterPath(), "minute": QPainterPath(), "second": QPainterPath()}
+        self.hands["hour"].addRoundedRect(QRectF(-2, -60, 3, 60), 1.5, 1.5)
+        self.hands["minute"].addRoundedRect(QRectF(-2, -75, 3, 80), 1.5, 1.5)
+        self.hands["second"].addRoundedRect(QRectF(-1, -80, 2, 80), 1, 1)
+        self.hands["second"].addRoundedRect(QRectF(-1, -1, 2, 20), 1, 1)  # Tail below the centre
+        self.hands["second"].setFillRule(Qt.WindingFill)  # Fill where the hand and tail overlap
+        # Bounding boxes for dirty regions, and tip distances for the one-pixel test
+        self.hand_bounds = {hand: path.boundingRect() for hand, path in self.hands.items()}
+        self.hand_lengths = {"hour": 60, "minute": 75, "second": 80}
+
+
+@lru_cache(maxsize=None)
+def clock_geometry(style):
+    return ClockGeometry(style)
+
+
+SECOND_HAND_COLOR = QColor("orange")
+
+
+class ClockPainting:
+    """Dial and hands drawing shared by the raster and OpenGL clocks.
+
+    Mixed into a QWidget subclass, which calls ``_init_clock`` from its
+    constructor, paints with ``_paint_clock`` and decides in ``_invalidate``
+    how much of itself to refresh when the hands move.
+    """
+    renderer = None
+
+    def _init_clock(self, dial_style="classic"):
         self.setMinimumSize(300, 300)
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update)
-        self.timer.start(8)  # Smooth for 120Hz movement
-
-    def paintEvent(self, event):
+        self.dial_style = dial_style
+        self.shapes = clock_geometry(dial_style)
+        # The dial never moves, so it is rendered once into a pixmap and
+        # only rebuilt when the size, device pixel ratio or theme changes.
+        self._face_cache = QPixmap()
+        self._face_key = None
+        # Angles the hands were last drawn at; paintEvent draws these, not "now",
+        # so every pixel painted agrees with the regions that were invalidated
+        self.angles = hand_angles()
+        self.frame_times = deque(maxlen=120)  # Milliseconds spent in recent paints
+        # Smooth hands: one step per display frame, repainting only what moved
+        self.frame_sub = FrameScheduler.instance().subscribe(self.advance_hands, FrameScheduler.FRAME, owner=self)
+
+    def invalidate_face(self):
+        """Drop the cached dial so it is redrawn on the next paint."""
+        self._face_key = None
+        self.update()
+
+    def set_dial_style(self, style):
+        self.dial_style = style
+        self.shapes = clock_geometry(style)
+        self.invalidate_face()
+
+    def resizeEvent(self, event):
+        self.invalidate_face()
+        super().resizeEvent(event)
+
+    def _apply_transform(self, painter):
         side = min(self.width(), self.height())
-        now = datetime.datetime.now()
-        second = now.second + now.microsecond / 1_000_000
-        minute = now.minute + second / 60
-        hour = now.hour % 12 + minute / 60
-
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
         painter.translate(self.width() / 2, self.height() / 2)
         painter.scale(side / 200.0, side / 200.0)
 
+    def _hand_rect(self, hand, angle):
+        """Widget pixels covered by ``hand`` at ``angle``, with room for antialiasing."""
+        side = min(self.width(), self.height())
+        transform = QTransform()
+        transform.translate(self.width() / 2, self.height() / 2)
+        transform.scale(side / 200.0, side / 200.0)
+        transform.rotate(angle)
+        return transform.mapRect(self.shapes.hand_bounds[hand]).toAlignedRect().adjusted(-2, -2, 2, 2)
+
+    def advance_hands(self):
+        """Move the hands to the current time and repaint just their old and new areas.
+
+        The second hand moves every frame. The minute and hour hands only
+        move once their tip would travel at least one device pixel, which is
+        every few seconds for the hour hand.
+        """
+        pixels_per_unit = min(self.width(), self.height()) / 200.0 * self.devicePixelRatioF()
+        hand_lengths = self.shapes.hand_lengths
+        dirty = QRegion()
+        for hand, angle in hand_angles().items():
+            old = self.angles[hand]
+            if angle == old:
+                continue
+            if hand != "second" and radians(abs(angle - old)) * hand_lengths[hand] * pixels_per_unit < 1:
+                continue
+            dirty += self._hand_rect(hand, old)
+            dirty += self._hand_rect(hand, angle)
+            self.angles[hand] = angle
+        if not dirty.isEmpty():
+            self._invalidate(dirty)
+
+    def frame_ms(self):
+        """Mean paint time over the recent frames, or None before the first paint."""
+        return sum(self.frame_times) / len(self.frame_times) if self.frame_times else None
+
+    def _face_pixmap(self):
+        dpr = self.devicePixelRatioF()
+        key = (self.width(), self.height(), dpr)
+        if key != self._face_key:
+            pixmap = QPixmap(round(self.width() * dpr), round(self.height() * dpr))
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.transparent)
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.Antialiasing)
+            painter.setFont(self.font())
+            self._apply_transform(painter)
+            self._draw_face(painter)
+            painter.end()
+            self._face_cache = pixmap
+            self._face_key = key
+        return self._face_cache
+
+    def _draw_face(self, painter):
         # Draw rounded square background
         painter.setBrush(QColor("#000000"))  # Light gray or any theme color
         painter.setPen(QPen(Qt.black, 1))
@@ -381,65 +889,398 @@ class AnalogClock(QWidget):
         painter.setBrush(QColor("white"))
         painter.drawEllipse(-90, -90, 180, 180)
 
-        
+        shapes = self.shapes
+        # Tick marks, each set in a single call
+        if shapes.minute_ticks:
+            painter.setPen(QPen(Qt.black, 1))
+            painter.drawLines(shapes.minute_ticks)
+        if shapes.hour_ticks:
+            painter.setPen(QPen(Qt.black, 3))
+            painter.drawLines(shapes.hour_ticks)
+
         # Draw numbers 1 to 12
         painter.setPen(QPen(Qt.black, 2))
         font = painter.font()
         font.setPointSize(10)
         font.setBold(True)
         painter.setFont(font)
+        for box, text in shapes.numerals:
+            painter.drawText(box, Qt.AlignCenter, text)
 
-        for i in range(1, 13):
-            angle = radians(i * 30)  # Convert degrees to radians
-            radius = 75  # Distance from center to number
-            x = radius * sin(angle)
-            y = -radius * cos(angle)  # Negative because Qt's y-axis goes down
-
-            # Center the text at (x, y)
-            rect_width = 20
-            rect_height = 20
-            painter.drawText(
-                int(x - rect_width / 2),
-                int(y - rect_height / 2),
-                rect_width,
-                rect_height,
-                Qt.AlignCenter,
-                str(i)
-            )
-
-
-        # Hour hand
-        painter.save()
-        painter.rotate(30 * hour)
-        painter.setBrush(Qt.black)
-        painter.setPen(Qt.NoPen)
-        painter.drawRoundedRect(-2, -60, 3, 60, 1.5, 1.5)  # width=3, height=45
-        painter.restore()
+    def _paint_clock(self, painter):
+        painter.drawPixmap(0, 0, self._face_pixmap())
+        painter.setRenderHint(QPainter.Antialiasing)
+        self._apply_transform(painter)
+
+        # Hands: prebuilt paths, only rotated here
+        hands = self.shapes.hands
+        for hand, colour in (("hour", Qt.black), ("minute", Qt.black), ("second", SECOND_HAND_COLOR)):
+            painter.save()
+            painter.rotate(self.angles[hand])
+            painter.setBrush(colour)
+            painter.setPen(Qt.NoPen)
+            painter.drawPath(hands[hand])
+            painter.restore()
 
-        # Minute hand
-        painter.save()
-        painter.rotate(6 * minute)
-        painter.setBrush(Qt.black)
-        painter.setPen(Qt.NoPen)
-        painter.drawRoundedRect(-2, -75, 3, 80, 1.5, 1.5)  # width=3, height=75
-        painter.restore()
+        # Center pivot
+        painter.setBrush(SECOND_HAND_COLOR)
+        painter.drawEllipse(-4, -4, 8, 8)
 
-        # Second hand (smooth!)
-        painter.save()
-        painter.rotate(6 * second)
-        painter.setBrush(QColor("orange"))
-        painter.setPen(Qt.NoPen)
 
-        # Main second hand
-        painter.drawRoundedRect(-1, -80, 2, 80, 1, 1)
+class AnalogClock(ClockPainting, QWidget):
+    """CPU renderer: QPainter on the widget's raster backing store."""
+    renderer = "raster"
 
-        # Tail (extends downward from center)
-        painter.drawRoundedRect(-1, -1, 2, 20, 1, 1)
-        painter.restore()
+    def __init__(self, dial_style="classic"):
+        super().__init__()
+        self._init_clock(dial_style)
+
+    def _invalidate(self, dirty):
+        self.update(dirty)
+
+    def paintEvent(self, event):
+        # Qt clips this to the invalidated region, so a partial update only
+        # blits and fills the pixels around the hands that moved
+        start = time.perf_counter()
+        painter = QPainter(self)
+        self._paint_clock(painter)
+        painter.end()
+        self.frame_times.append((time.perf_counter() - start) * 1000)
+
+
+if QOpenGLWidget is not None:
+    class GLAnalogClock(ClockPainting, QOpenGLWidget):
+        """GPU renderer: the same drawing through QPainter's OpenGL paint engine.
+
+        The engine uploads the face pixmap as a texture the first time it is
+        drawn and reuses it for as long as the cached pixmap is unchanged, so
+        each frame is one textured quad plus the hands as transformed shapes.
+        """
+        renderer = "opengl"
+
+        def __init__(self, dial_style="classic"):
+            super().__init__()
+            self._init_clock(dial_style)
+
+        def _invalidate(self, dirty):
+            self.update()  # GL frames are always redrawn whole
+
+        def paintGL(self):
+            start = time.perf_counter()
+            painter = QPainter(self)
+            painter.fillRect(self.rect(), self.palette().window())  # The face has transparent corners
+            self._paint_clock(painter)
+            painter.end()
+            self.frame_times.append((time.perf_counter() - start) * 1000)
+
+
+CLOCK_RENDERERS = {"raster": "Raster (CPU)", "opengl": "OpenGL"}
+# The OpenGL clock is only offered in Settings with --opengl-clock until it has been
+# checked against the raster one on real drivers: benchmarks/clock_paint.py --verify-opengl
+OPENGL_CLOCK_ENABLED = "--opengl-clock" in sys.argv
+
+
+@lru_cache(maxsize=None)
+def opengl_available():
+    """Whether an OpenGL context can be created here (no driver, RDP, trimmed build...)."""
+    return QOpenGLWidget is not None and QOpenGLContext().create()
+
+
+def make_clock(renderer, dial_style="classic"):
+    """An analog clock for ``renderer`` ("raster" or "opengl"), on raster if OpenGL is unavailable."""
+    if renderer == "opengl" and opengl_available():
+        return GLAnalogClock(dial_style)
+    return AnalogClock(dial_style)
+
+def visible_rows(view):
+    """(first, last) rows a list view currently shows, or None when it is empty."""
+    count = view.model().rowCount()
+    if count == 0:
+        return None
+    top = view.indexAt(QPoint(0, 0))
+    bottom = view.indexAt(QPoint(0, view.viewport().height() - 1))
+    return (top.row() if top.isValid() else 0, bottom.row() if bottom.isValid() else count - 1)
+
+
+# ---------- Multiple Timers ----------
+class MultiTimerModel(QAbstractListModel):
+    def __init__(self, engine, parent=None):
+        super().__init__(parent)
+        self.engine = engine
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.engine)
+
+    def data(self, index, role=Qt.DisplayRole):
+        # Rows are formatted on demand, so only rows the view paints cost anything
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        timer = self.engine.timers[index.row()]
+        return f"{timer.name:<16}{format_hms(self.engine.remaining_secs(timer)):<12}{timer.state}"
+
+    def add_timer(self, name, duration_ms):
+        row = len(self.engine)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.engine.add(name, duration_ms)
+        self.endInsertRows()
+
+    def cancel_timer(self, name):
+        row = self.engine.index_of(name)
+        self.beginRemoveRows(QModelIndex(), row, row)
+        self.engine.cancel(name)
+        self.endRemoveRows()
+
+    def refresh_rows(self, first, last):
+        self.dataChanged.emit(self.index(first), self.index(last), [Qt.DisplayRole])
+
+
+class MultiTimerPage(QWidget):
+    def __init__(self, stack, main_page):
+        super().__init__()
+        self.stack = stack
+        self.main_page = main_page
+        self.engine = MultiTimerEngine()
+        self.model = MultiTimerModel(self.engine, self)
+        self._auto_name = 0
+
+        # One OS timer for every countdown, always armed for the earliest deadline
+        self.alarm = QTimer(self)
+        self.alarm.setSingleShot(True)
+        self.alarm.setTimerType(Qt.PreciseTimer)
+        self.alarm.timeout.connect(self._on_alarm)
+
+        self.title = QLabel("Timers")
+        self.title.setStyleSheet("font-size: 48px; font-weight: bold; background: transparent;")
+        self.title.setAlignment(Qt.AlignCenter)
+
+        self.name_edit = QLineEdit()
+        self.name_edit.setPlaceholderText("Name")
+        self.duration_edit = QTimeEdit()
+        self.duration_edit.setDisplayFormat("hh:mm:ss")
+        self.add_btn = QPushButton("Add")
+
+        add_layout = QHBoxLayout()
+        add_layout.addWidget(self.name_edit)
+        add_layout.addWidget(self.duration_edit)
+        add_layout.addWidget(self.add_btn)
+
+        self.view = QListView()
+        self.view.setModel(self.model)
+        self.view.setUniformItemSizes(True)  # Lets the view skip measuring every row
+        self.view.setSelectionMode(QListView.ExtendedSelection)
+
+        self.pause_btn = QPushButton("Pause")
+        self.resume_btn = QPushButton("Resume")
+        self.cancel_btn = QPushButton("Cancel")
+        btn_layout = QHBoxLayout()
+        btn_layout.addWidget(self.pause_btn)
+        btn_layout.addWidget(self.resume_btn)
+        btn_layout.addWidget(self.cancel_btn)
+
+        self.status = QLabel()
+        self.status.setStyleSheet("color: gray; background: transparent;")
+        self.back_btn = QPushButton("Back")
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(self.title)
+        layout.addLayout(add_layout)
+        layout.addWidget(self.view)
+        layout.addLayout(btn_layout)
+        layout.addWidget(self.status)
+        layout.addWidget(self.back_btn)
+
+        self.add_btn.clicked.connect(self.add_timer)
+        self.name_edit.returnPressed.connect(self.add_timer)
+        self.pause_btn.clicked.connect(lambda: self._apply_to_selected(self.engine.pause))
+        self.resume_btn.clicked.connect(lambda: self._apply_to_selected(self.engine.resume))
+        self.cancel_btn.clicked.connect(self.cancel_selected)
+        self.back_btn.clicked.connect(lambda: self.stack.setCurrentWidget(self.main_page))
+
+        FrameScheduler.instance().subscribe(self._refresh_visible_rows, FrameScheduler.SECOND, owner=self.view)
+
+    def add_timer(self):
+        duration_ms = QTime(0, 0).msecsTo(self.duration_edit.time())
+        if duration_ms <= 0:
+            QMessageBox.warning(self, "Warning", "Set a time before adding.")
+            return
+        name = self.name_edit.text().strip()
+        if not name:
+            self._auto_name += 1
+            name = f"Timer {self._auto_name}"
+            while name in self.engine:
+                self._auto_name += 1
+                name = f"Timer {self._auto_name}"
+        if name in self.engine:
+            QMessageBox.warning(self, "Warning", f"A timer named {name} already exists.")
+            return
+        self.model.add_timer(name, duration_ms)
+        self.name_edit.clear()
+        self._arm_alarm()
+
+    def _selected_names(self):
+        rows = sorted(index.row() for index in self.view.selectionModel().selectedRows())
+        return [self.engine.timers[row].name for row in rows]
+
+    def _apply_to_selected(self, action):
+        for name in self._selected_names():
+            action(name)
+            row = self.engine.index_of(name)
+            self.model.refresh_rows(row, row)
+        self._arm_alarm()
+
+    def cancel_selected(self):
+        for name in self._selected_names():
+            self.model.cancel_timer(name)
+        self._arm_alarm()
+
+    def _arm_alarm(self):
+        delay = self.engine.ms_until_next_deadline()
+        if delay is None:
+            self.alarm.stop()
+        else:
+            self.alarm.start(delay)
+
+    def _on_alarm(self):
+        finished = self.engine.pop_expired()
+        for timer in finished:
+            row = self.engine.index_of(timer.name)
+            self.model.refresh_rows(row, row)
+        if finished:
+            self.status.setText("Finished: " + ", ".join(timer.name for timer in finished))
+            QApplication.beep()
+        self._arm_alarm()
+
+    def _refresh_visible_rows(self):
+        rows = visible_rows(self.view)
+        if rows:
+            self.model.refresh_rows(*rows)
+
+
+# ---------- World Clock ----------
+@lru_cache(maxsize=None)
+def local_zone_key():
+    """IANA name of the system time zone, asked of the OS once (Qt maps Windows zone names)."""
+    return bytes(QTimeZone.systemTimeZoneId()).decode() or "UTC"
+
+
+class WorldClockModel(QAbstractListModel):
+    def __init__(self, engine, parent=None):
+        super().__init__(parent)
+        self.engine = engine
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.engine)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        zone = self.engine.zones[index.row()]
+        if role == Qt.ToolTipRole:
+            return zone.key
+        if role != Qt.DisplayRole:
+            return None
+        # Offsets are cached per zone, so a row is an addition and a table lookup
+        city = zone.key.rsplit("/", 1)[-1].replace("_", " ")
+        return f"{city:<20}{format_hms(self.engine.local_seconds(zone)):<12}{zone.abbreviation:<7}{zone.offset_text()}"
+
+    def add_zone(self, key):
+        if key in self.engine:
+            raise ValueError(f"{key} is already shown")
+        ZoneInfo(key)  # Unknown names raise here, before the view hears of a new row
+        row = len(self.engine)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.engine.add(key)
+        self.endInsertRows()
+
+    def remove_zone(self, key):
+        row = self.engine.index_of(key)
+        self.beginRemoveRows(QModelIndex(), row, row)
+        self.engine.remove(key)
+        self.endRemoveRows()
+
+    def refresh_rows(self, first, last):
+        self.dataChanged.emit(self.index(first), self.index(last), [Qt.DisplayRole])
+
+
+class WorldClockPage(QWidget):
+    def __init__(self, stack, main_page):
+        super().__init__()
+        self.stack = stack
+        self.main_page = main_page
+        self.engine = WorldClock()
+        self.model = WorldClockModel(self.engine, self)
+
+        self.title = QLabel("World Clock")
+        self.title.setStyleSheet("font-size: 48px; font-weight: bold; background: transparent;")
+        self.title.setAlignment(Qt.AlignCenter)
+        self.local_label = QLabel(f"Local zone: {local_zone_key()}")
+        self.local_label.setStyleSheet("color: gray; background: transparent;")
+        self.local_label.setAlignment(Qt.AlignCenter)
+
+        # Type part of any zone name, e.g. "tokyo" or "america/"
+        self.zone_edit = QLineEdit()
+        self.zone_edit.setPlaceholderText("Add a time zone")
+        completer = QCompleter(sorted(available_timezones()), self.zone_edit)
+        completer.setCaseSensitivity(Qt.CaseInsensitive)
+        completer.setFilterMode(Qt.MatchContains)
+        self.zone_edit.setCompleter(completer)
+        self.add_btn = QPushButton("Add")
+        add_layout = QHBoxLayout()
+        add_layout.addWidget(self.zone_edit)
+        add_layout.addWidget(self.add_btn)
+
+        self.view = QListView()
+        self.view.setModel(self.model)
+        self.view.setUniformItemSizes(True)
+        self.view.setSelectionMode(QListView.ExtendedSelection)
+
+        self.remove_btn = QPushButton("Remove")
+        self.back_btn = QPushButton("Back")
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(self.title)
+        layout.addWidget(self.local_label)
+        layout.addLayout(add_layout)
+        layout.addWidget(self.view)
+        layout.addWidget(self.remove_btn)
+        layout.addWidget(self.back_btn)
+
+        self.add_btn.clicked.connect(self.add_zone)
+        self.zone_edit.returnPressed.connect(self.add_zone)
+        self.remove_btn.clicked.connect(self.remove_selected)
+        self.back_btn.clicked.connect(lambda: self.stack.setCurrentWidget(self.main_page))
+
+        try:
+            self.model.add_zone(local_zone_key())
+        except (ValueError, ZoneInfoNotFoundError):
+            self.model.add_zone("UTC")
+        FrameScheduler.instance().subscribe(self._tick, FrameScheduler.SECOND, owner=self.view)
+
+    def add_zone(self, key=None):
+        key = key or self.zone_edit.text().strip()
+        if not key:
+            return
+        if key in self.engine:
+            QMessageBox.warning(self, "Warning", f"{key} is already shown.")
+            return
+        try:
+            self.model.add_zone(key)
+        except (ValueError, ZoneInfoNotFoundError):
+            QMessageBox.warning(self, "Warning", f"Unknown time zone: {key}")
+            return
+        self.zone_edit.clear()
+
+    def remove_selected(self):
+        rows = sorted(index.row() for index in self.view.selectionModel().selectedRows())
+        for key in [self.engine.zones[row].key for row in rows]:
+            self.model.remove_zone(key)
+
+    def _tick(self):
+        self.engine.refresh()  # Only zones that just crossed a transition are looked up again
+        rows = visible_rows(self.view)
+        if rows:
+            self.model.refresh_rows(*rows)
 
-        # Center pivot
-        painter.setBrush(QColor("orange"))
-        painter.drawEllipse(-4, -4, 8, 8)
 
 class Setting(QWidget):
     def __init__(self, stack, main_page, timer_widget):
@@ -462,6 +1303,43 @@ class Setting(QWidget):
         self.DarkmodeCB.setChecked(True)
         self.DarkmodeCB.stateChanged.connect(self.DM)
 
+        # Lap export format (written as laps are recorded)
+        export_LO = QHBoxLayout()
+        export_LO.addWidget(QLabel("Lap export"))
+        self.ExportCB = QComboBox()
+        for label, fmt in (("Off", None), ("CSV", "csv"), ("JSONL", "jsonl"), ("Columnar", "columnar")):
+            self.ExportCB.addItem(label, fmt)
+        self.ExportCB.setToolTip(f"Saved to {Stopwatch.export_folder()}")
+        export_LO.addWidget(self.ExportCB)
+        layout.addLayout(export_LO)
+        self.ExportCB.currentIndexChanged.connect(self.set_lap_export)
+
+        # Clock renderer, with the measured paint time so each machine can pick its faster one
+        renderer_LO = QHBoxLayout()
+        renderer_LO.addWidget(QLabel("Clock renderer"))
+        self.RendererCB = QComboBox()
+        for renderer, label in CLOCK_RENDERERS.items():
+            if renderer != "opengl" or OPENGL_CLOCK_ENABLED:
+                self.RendererCB.addItem(label, renderer)
+        renderer_LO.addWidget(self.RendererCB)
+        layout.addLayout(renderer_LO)
+        self.RendererCB.currentIndexChanged.connect(self.set_clock_renderer)
+        self.FrameTimeLB = QLabel()
+        self.FrameTimeLB.setStyleSheet("font-size: 12px; color: gray; background: transparent;")
+        layout.addWidget(self.FrameTimeLB, alignment=Qt.AlignCenter)
+        self.frame_times = {}  # Renderer -> last mean paint time seen
+
+        # Dial style
+        dial_LO = QHBoxLayout()
+        dial_LO.addWidget(QLabel("Dial"))
+        self.DialCB = QComboBox()
+        for style, (label, *_) in DIAL_STYLES.items():
+            self.DialCB.addItem(label, style)
+        dial_LO.addWidget(self.DialCB)
+        layout.addLayout(dial_LO)
+        self.DialCB.currentIndexChanged.connect(self.set_dial_style)
+        FrameScheduler.instance().subscribe(self.update_frame_time, FrameScheduler.SECOND, owner=self.FrameTimeLB)
+
         # Apply and back buttons
         btn_layout = QHBoxLayout()
         self.back_btn = QPushButton("Back")
@@ -475,32 +1353,125 @@ class Setting(QWidget):
         else:
             self.timer_widget.apply_light_mode()
 
+    def set_lap_export(self):
+        self.timer_widget.set_lap_export(self.ExportCB.currentData())
+
+    def set_dial_style(self):
+        self.timer_widget.analog_clock.set_dial_style(self.DialCB.currentData())
+
+    def set_clock_renderer(self):
+        requested = self.RendererCB.currentData()
+        renderer = self.timer_widget.set_clock_renderer(requested)
+        if renderer != requested:
+            self.RendererCB.blockSignals(True)
+            self.RendererCB.setCurrentIndex(self.RendererCB.findData(renderer))
+            self.RendererCB.blockSignals(False)
+            QMessageBox.warning(self, "Warning", "OpenGL is not available here; the clock stays on raster.")
+        self.update_frame_time()
+
+    def update_frame_time(self):
+        clock = self.timer_widget.analog_clock
+        if clock.frame_ms() is not None:
+            self.frame_times[clock.renderer] = clock.frame_ms()
+        times = "   ".join(f"{CLOCK_RENDERERS[name]} {ms:.2f} ms" for name, ms in self.frame_times.items())
+        self.FrameTimeLB.setText(
+            f"Clock paint: {times or '--'}\n"
+            f"Frames skipped while hidden: {FrameScheduler.instance().skipped_frames}"
+        )
+
     def go_back(self):
         self.stack.setCurrentWidget(self.previous_page)
 
+class LapModel(QAbstractListModel):
+    """A LapRecorder's laps, formatted per visible row.
+
+    The current fastest and slowest laps are coloured in the view.
+    """
+    BEST_COLOR = QColor("#2EB82E")
+    WORST_COLOR = QColor("#E04040")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.recorder = LapRecorder()
+        self.totals = self.recorder.totals
+        self.stats = self.recorder.stats
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.totals)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        if role == Qt.ForegroundRole:
+            if self.stats.count < 2:
+                return None
+            if row == self.stats.best_index:
+                return self.BEST_COLOR
+            if row == self.stats.worst_index:
+                return self.WORST_COLOR
+            return None
+        if role != Qt.DisplayRole:
+            return None
+        return f"Lap {row + 1:<18}+{format_ms(self.recorder.split(row)):<25}{format_ms(self.totals[row])}"
+
+    def load(self, totals):
+        """Replace all laps at once (used when restoring a session)."""
+        self.beginResetModel()
+        self.recorder.load(totals)
+        self.endResetModel()
+
+    def append_lap(self, total_ms):
+        row = len(self.recorder)
+        old_marked = (self.stats.best_index, self.stats.worst_index)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.recorder.add(total_ms)
+        self.endInsertRows()
+        # Recolour the rows that stopped being the fastest/slowest (and the
+        # first lap, which only gets a colour once there is a second one)
+        for old in set(old_marked) - {None, row}:
+            self.dataChanged.emit(self.index(old), self.index(old), [Qt.ForegroundRole])
+
+    def clear(self):
+        self.beginResetModel()
+        self.recorder.clear()
+        self.endResetModel()
+
+
 class Stopwatch(QWidget):
-    def __init__(self, stack, main_page, settings_page):
+    def __init__(self, stack, main_page, timer_widget):
         super().__init__()
         self.stack = stack
         self.main_page = main_page
-        self.settings_page = settings_page
+        self.timer_widget = timer_widget
 
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_display)
+        self.frame_sub = FrameScheduler.instance().subscribe(
+            self.update_display, FrameScheduler.FRAME, owner=self, active=False
+        )
+        # Nanosecond clock for the engine; the display only samples it once per frame
         self.elapsed_timer = QElapsedTimer()
-        self.accumulated = 0
-        self.is_running = False
+        self.elapsed_timer.start()
+        self.engine = StopwatchEngine(clock=self.elapsed_timer.nsecsElapsed)
         self.last_lap_time = 0
-        self.laps = []
+        self.lap_model = LapModel(self)
+        self.laps = self.lap_model.totals
+        self.export_format = None
+        self.exporter = None
+        self.journal = None
+        QApplication.instance().aboutToQuit.connect(self.close_export)
 
         self.clock_display = QLabel()
         self.clock_display.setStyleSheet("font-size: 24px; color: gray; background: transparent;")
         self.clock_display.setAlignment(Qt.AlignCenter)
+        self.clock_text = TimeLabel(self.clock_display, clock_label_text)
         self._update_clock()
+        FrameScheduler.instance().subscribe(self._update_clock, FrameScheduler.SECOND, owner=self)
 
-        self.display = QLabel("00:00:00:000")
+        self.display = QLabel()
         self.display.setStyleSheet("font-size: 48px; font-weight: bold; background: transparent;")
         self.display.setAlignment(Qt.AlignCenter)
+        self.display_text = TimeLabel(self.display, format_ms)
+        self.display_text.show(0)
 
         self.laps_display_title = QLabel(f"{"Lap":<11}{"Time":15}{"Total"}    ")
         self.laps_display_title.setStyleSheet("font-size: 24px; font-weight: bold; background: transparent;")
@@ -520,9 +1491,24 @@ class Stopwatch(QWidget):
         btn_layout.addWidget(self.lap_btn)
         btn_layout.addWidget(self.reset_btn)
 
-        self.laps_display = QTextEdit()
-        self.laps_display.setReadOnly(True)
-        self.laps_display.setFixedHeight(350)  # Fixed height for scrollbar
+        # A headerless one-column table: unlike QListView it never re-lays out
+        # every row when a lap is appended, and only visible rows get formatted
+        self.laps_display = QTableView()
+        self.laps_display.setModel(self.lap_model)
+        self.laps_display.horizontalHeader().hide()
+        self.laps_display.horizontalHeader().setStretchLastSection(True)
+        self.laps_display.verticalHeader().hide()
+        self.laps_display.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.laps_display.verticalHeader().setDefaultSectionSize(self.fontMetrics().height() + 4)
+        self.laps_display.setShowGrid(False)
+        self.laps_display.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.laps_display.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.laps_display.setFixedHeight(300)  # Fixed height for scrollbar
+
+        self.stats_display = QLabel()
+        self.stats_display.setStyleSheet("font-size: 12px; color: gray; background: transparent;")
+        self.stats_display.setAlignment(Qt.AlignCenter)
+        self.update_stats_display()
 
         layout = QVBoxLayout(self)
         layout.addWidget(self.clock_display)
@@ -530,47 +1516,16 @@ class Stopwatch(QWidget):
         layout.addLayout(btn_layout)
         layout.addWidget(self.laps_display_title)
         layout.addWidget(self.laps_display)
+        layout.addWidget(self.stats_display)
 
         self.start_btn.clicked.connect(self.start)
         self.pause_btn.clicked.connect(self.pause)
         self.reset_btn.clicked.connect(self.reset)
-        self.lap_btn.clicked.connect(self.record_lap)
-
-        self.main_timer_btn = QPushButton()
-        timer_icon_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), "3158183.png")
-        self.main_timer_btn.setIcon(QIcon(timer_icon_file))
-        self.main_timer_btn.setIconSize(QSize(32, 32))
-        self.main_timer_btn.setFixedSize(50, 50)
-        self.main_timer_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #404040;
-                border-radius: 15px;
-                border: 1px solid #565859;
-            }
-            QPushButton:hover { background-color: #999999; }
-            QPushButton:pressed {
-                background-color: #202020;
-                border: 1px solid #2e2e2e;
-            }
-        """)
-
-        self.setting_btn = QPushButton()
-        setting_icon_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), "setting.png")
-        self.setting_btn.setIcon(QIcon(setting_icon_file))
-        self.setting_btn.setIconSize(QSize(32, 32))
-        self.setting_btn.setFixedSize(50, 50)
-        self.setting_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #404040;
-                border-radius: 15px;
-                border: 1px solid #565859;
-            }
-            QPushButton:hover { background-color: #999999; }
-            QPushButton:pressed {
-                background-color: #202020;
-                border: 1px solid #2e2e2e;
-            }
-        """)
+        self.lap_btn.pressed.connect(self.record_lap)  # On press, not release, which comes later
+
+        self.main_timer_btn = make_icon_button(asset_icon("3158183.png"))
+
+        self.setting_btn = make_icon_button(asset_icon("setting.png"))
 
         nav_layout = QHBoxLayout()
         nav_layout.addItem(QSpacerItem(0, 0, QSizePolicy.Expanding, QSizePolicy.Minimum))
@@ -583,109 +1538,163 @@ class Stopwatch(QWidget):
         self.main_timer_btn.clicked.connect(lambda: self.stack.setCurrentWidget(self.main_page))
         self.setting_btn.clicked.connect(lambda: self.stack.parent().show_settings_from(self))
 
+    @property
+    def is_running(self):
+        return self.engine.running
+
     def start(self):
         if not self.is_running:
-            self.elapsed_timer.start()
-            self.timer.start(8)  # Update every 8ms for smooth milliseconds
-            self.is_running = True
+            self.engine.start()
+            self._record("start", accumulated_ms=self.engine.elapsed_ms(), anchor=anchors())
+            FrameScheduler.instance().resume(self.frame_sub)  # Refresh once per display frame
             self.start_btn.setEnabled(False)
             self.pause_btn.setEnabled(True)
             self.lap_btn.setEnabled(True)
 
     def pause(self):
         if self.is_running:
-            self.accumulated += self.elapsed_timer.elapsed()
-            self.timer.stop()
-            self.is_running = False
+            self.engine.pause()
+            self._record("pause", accumulated_ms=self.engine.elapsed_ms())
+            self.update_display()  # Show the exact stopped time, not the last frame's
+            FrameScheduler.instance().pause(self.frame_sub)
             self.start_btn.setEnabled(True)
             self.pause_btn.setEnabled(False)
             self.lap_btn.setEnabled(False)
 
     def reset(self):
-        self.timer.stop()
-        self.elapsed_timer.invalidate()
-        self.accumulated = 0
-        self.display.setText("00:00:00:000")
-        self.is_running = False
+        FrameScheduler.instance().pause(self.frame_sub)
+        self.engine.reset()
+        self._record("reset")
+        self.display_text.show(0)
         self.start_btn.setEnabled(True)
         self.pause_btn.setEnabled(False)
         self.lap_btn.setEnabled(False)
-        self.laps_display.clear()
-        self.laps = []
+        self.lap_model.clear()
+        self.update_stats_display()
         self.last_lap_time = 0
+        self.close_export()
 
     def update_display(self):
-        if self.is_running:
-            elapsed_ms = self.accumulated + self.elapsed_timer.elapsed()
-        else:
-            elapsed_ms = self.accumulated
-        t = QTime(0, 0).addMSecs(elapsed_ms)
-        self.display.setText(t.toString("hh:mm:ss:zzz"))
+        self.display_text.show(self.engine.elapsed_ms())
 
-    def record_lap(self):
+    def record_lap(self, at=None):
+        """Lap at clock reading ``at``, by default the moment the Lap button went down."""
+        if at is None:
+            at = self.engine.now()  # Before any other work, so the lap is not late by it
         if not self.is_running:
             return
-        if self.is_running:
-            current_ms = self.accumulated + self.elapsed_timer.elapsed()
-        else:
-            current_ms = self.accumulated
-        diff_ms = current_ms - self.last_lap_time
-        lap_num = len(self.laps) + 1
-        diff_time = QTime(0, 0).addMSecs(diff_ms).toString("hh:mm:ss:zzz")
-        total_time = QTime(0, 0).addMSecs(current_ms).toString("hh:mm:ss:zzz")
-        line = f"Lap {lap_num:<18}+{diff_time:<25}{total_time}"
-        self.laps_display.append(line)
-        self.laps.append(current_ms)
+        current_ms = self.engine.elapsed_ms(at)
+        self.lap_model.append_lap(current_ms)
+        self._record("lap", total_ms=current_ms)
+        self.laps_display.scrollToBottom()
+        if self.export_format:
+            self._export_lap(current_ms)
         self.last_lap_time = current_ms
+        self.update_stats_display()
 
-    def _update_clock(self):
-        current_time = datetime.datetime.now().strftime("%H:%M:%S")
-        self.clock_display.setText(f"Time: {current_time}")
-        QTimer.singleShot(1000, self._update_clock)  # Update every second
+    # ---------- Session Journal ----------
+    def _record(self, event, **fields):
+        if self.journal is not None:
+            self.journal.record("stopwatch", event, **fields)
 
-    def apply_light_mode(self):
-        icon_style = """
-            QPushButton {
-                background-color: transparent;
-                border-radius: 15px;
-                border: 1px solid #565859;
-            }
-            QPushButton:hover { background-color: #999999; }
-            QPushButton:pressed {
-                background-color: #202020;
-                border: 1px solid #2e2e2e;
-            }
-        """
-        self.main_timer_btn.setStyleSheet(icon_style)
-        self.setting_btn.setStyleSheet(icon_style)
+    def restore(self, saved):
+        if saved["state"] == "idle":
+            return
+        self.lap_model.load(saved["laps"])
+        self.laps_display.scrollToBottom()
+        self.last_lap_time = saved["laps"][-1] if saved["laps"] else 0
+        self.update_stats_display()
+        accumulated_ms = saved["accumulated_ms"]
+        if saved["state"] == "running":
+            accumulated_ms += elapsed_since(saved["anchor"])
+        self.engine.reset(accumulated_ms * NS_PER_MS)
+        if saved["state"] == "running":
+            self.start()
+        else:
+            self.update_display()
 
-    def apply_dark_mode(self):
-        icon_style = """
-            QPushButton {
-                background-color: #1E1E1E;
-                border-radius: 15px;
-                border: 1px solid #565859;
-            }
-            QPushButton:hover { background-color: #666666; }               
-            QPushButton:pressed {
-                background-color: #202020;
-                border: 1px solid #2e2e2e;
-            }
-        """
-        self.main_timer_btn.setStyleSheet(icon_style)
-        self.setting_btn.setStyleSheet(icon_style)
+    # ---------- Lap Export ----------
+    @staticmethod
+    def export_folder():
+        documents = QStandardPaths.writableLocation(QStandardPaths.DocumentsLocation)
+        return os.path.join(documents, "Timer Laps")
+
+    def set_export_format(self, fmt):
+        self.export_format = fmt
+        self.close_export()  # The next lap starts a file in the new format
+
+    def close_export(self):
+        exporter, self.exporter = self.exporter, None
+        if exporter is not None:
+            try:
+                exporter.close()
+            except OSError as e:
+                self._export_failed(f"Could not write the lap export file:\n{e}")
+
+    def _export_failed(self, message):
+        # Through the coordinator, so Settings shows "Off" and choosing a format again takes effect
+        self.timer_widget.set_lap_export(None)
+        QMessageBox.warning(self, "Warning", message)
+
+    def _export_lap(self, current_ms):
+        if self.exporter is None:
+            file_name = datetime.datetime.now().strftime("laps-%Y%m%d-%H%M%S") + LAP_EXPORT_EXTENSIONS[self.export_format]
+            try:
+                os.makedirs(self.export_folder(), exist_ok=True)
+                self.exporter = LapExporter(os.path.join(self.export_folder(), file_name), self.export_format)
+            except OSError as e:
+                self._export_failed(f"Could not open the lap export file:\n{e}")
+                return
+        try:
+            self.exporter.write_lap(len(self.laps), current_ms - self.last_lap_time, current_ms, time.time_ns() // 1_000_000)
+        except OSError as e:  # The writer thread has already stopped and closed the file
+            self.exporter = None
+            self._export_failed(f"Could not write the lap export file:\n{e}")
+
+    def update_stats_display(self):
+        stats = self.lap_model.stats
+        if stats.count == 0:
+            self.stats_display.setText("Best --   Worst --\nMean --   SD --\nMedian --   P95 --")
+            return
+        def fmt(ms):
+            return format_ms(round(ms))
+
+        self.stats_display.setText(
+            f"Best {fmt(stats.best)}   Worst {fmt(stats.worst)}\n"
+            f"Mean {fmt(stats.mean)}   SD {fmt(stats.stdev)}\n"
+            f"Median {fmt(stats.median)}   P95 {fmt(stats.p95)}"
+        )
+
+    def _update_clock(self):
+        self.clock_text.show(int(time.time()))
 
+def journal_folder(argv):
+    """Where the session journal lives; ``--journal-dir=PATH`` moves it (the benchmarks use a temp folder)."""
+    for arg in argv:
+        if arg.startswith("--journal-dir="):
+            return arg.partition("=")[2]
+    return QStandardPaths.writableLocation(QStandardPaths.AppLocalDataLocation)
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
-    app.setWindowIcon(QIcon("app_icon.ico"))  # Global icon
+    app.setApplicationName("Timer")
+    app.setWindowIcon(QIcon(asset_path("app_icon.ico")))  # Global icon
     window = QMainWindow()
     timer_widget = CountdownTimer()
+    # Picks up running timers from the last session, e.g. after a crash or forced update.
+    # Only one window owns the journal; any other runs without one instead of
+    # replaying the first window's timers and interleaving events with it.
+    folder = journal_folder(sys.argv)
+    os.makedirs(folder, exist_ok=True)
+    journal_lock = QLockFile(os.path.join(folder, "session.lock"))
+    journal_lock.setStaleLockTime(0)  # Stale only when the owning process is gone, never by age
+    if journal_lock.tryLock(0):
+        timer_widget.attach_journal(SessionJournal(folder))
     window.setCentralWidget(timer_widget)
     window.setWindowTitle("Timer with Clock")
     window.resize(350, 610)
     window.setMaximumSize(350, 610)
     window.setMinimumSize(350, 610)
-    window.setWindowIcon(QIcon("3158183.ico"))
+    window.setWindowIcon(QIcon(asset_path("3158183.ico")))
     window.show()
     sys.exit(app.exec())
\ No newline at end of file
@@ -1,11 +1,12 @@
 # -*- mode: python ; coding: utf-8 -*-
+import os
 
 
 a = Analysis(
     ['Timer.py'],
-    pathex=[],
+    pathex=[os.path.join(SPECPATH, '..')],  # The shared timer/core package
     binaries=[],
-    datas=[('setting.png', '.'), ('stopwatch.png', '.'), ('3158183.png', '.')],
+    datas=[('setting.png', '.'), ('stopwatch.png', '.'), ('3158183.png', '.'), ('app_icon.ico', '.'), ('3158183.ico', '.')],
     hiddenimports=[],
     hookspath=[],
     hooksconfig={},
@@ -0,0 +1,82 @@
+# assets.py
+# Image assets: each file is decoded once per size and screen scale, then shared
+import os
+from functools import lru_cache
+
+from PySide6.QtCore import QFile, QFileInfo, QSize, QStandardPaths, Qt
+from PySide6.QtGui import QGuiApplication, QIcon, QImage, QImageReader, QPixmap, QPixmapCache
+
+try:
+    import assets_rc  # noqa: F401  Compiled from assets.qrc with pyside6-rcc; optional
+except ImportError:
+    pass
+
+ASSET_DIR = os.path.dirname(os.path.abspath(__file__))
+RESOURCE_PREFIX = ":/timer/"
+
+_icons = {}  # (name, size) -> QIcon, so every button using an image shares one
+
+
+def asset_path(name):
+    """Path of asset ``name``: inside the compiled resource when it is loaded, else on disk."""
+    if QFile.exists(RESOURCE_PREFIX + name):
+        return RESOURCE_PREFIX + name
+    return os.path.join(ASSET_DIR, name)
+
+
+@lru_cache(maxsize=None)
+def _scaled_dir():
+    return os.path.join(QStandardPaths.writableLocation(QStandardPaths.CacheLocation), "assets")
+
+
+def _scaled_file(path, pixels):
+    # Size and modification time in the name, so an edited asset is scaled again
+    info = QFileInfo(path)
+    stamp = f"{info.size()}-{info.lastModified().toMSecsSinceEpoch()}"
+    return os.path.join(_scaled_dir(), f"{info.completeBaseName()}-{pixels}px-{stamp}.png")
+
+
+def _load_scaled(path, pixels):
+    """Decode ``path`` to fit ``pixels`` square, reusing the copy saved by an earlier launch."""
+    scaled_file = _scaled_file(path, pixels)
+    image = QImage(scaled_file)
+    if image.isNull():
+        reader = QImageReader(path)
+        source = reader.size()
+        if source.isValid():
+            reader.setScaledSize(source.scaled(QSize(pixels, pixels), Qt.KeepAspectRatio))
+        image = reader.read()
+        try:
+            os.makedirs(_scaled_dir(), exist_ok=True)
+            image.save(scaled_file)
+        except OSError:
+            pass  # Read-only profile: still works, just decodes again next launch
+    return image
+
+
+def asset_pixmap(name, size, dpr=1.0):
+    """``name`` scaled to ``size`` logical pixels for a screen with device pixel ratio ``dpr``.
+
+    Large sources such as stopwatch.png are decoded straight to the target
+    size and never held at full resolution; the scaled copy is also saved to
+    the user cache folder for later launches. Pixmaps live in QPixmapCache,
+    which evicts the least recently used ones over its limit.
+    """
+    key = f"asset:{name}:{size}:{dpr}"
+    pixmap = QPixmapCache.find(key)
+    if pixmap is None or pixmap.isNull():
+        pixmap = QPixmap.fromImage(_load_scaled(asset_path(name), round(size * dpr)))
+        pixmap.setDevicePixelRatio(dpr)
+        QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+
+def asset_icon(name, size=32):
+    """Icon with ``name`` pre-scaled to ``size`` for every connected screen's scale."""
+    icon = _icons.get((name, size))
+    if icon is None:
+        icon = _icons[(name, size)] = QIcon()
+        ratios = {1.0} | {screen.devicePixelRatio() for screen in QGuiApplication.screens()}
+        for dpr in sorted(ratios):
+            icon.addPixmap(asset_pixmap(name, size, dpr))
+    return icon
@@ -0,0 +1,141 @@
+# clock_paint.py
+# Frame cost of the analog clock at several sizes, per renderer.
+#
+#   python benchmarks/clock_paint.py --sizes 300 600 1200 --frames 300
+#
+# "raster full" is the old behaviour (update() every frame); "raster dirty" is
+# AnalogClock.advance_hands, which invalidates only the areas around the hands
+# that moved; "opengl" is GLAnalogClock, skipped when no OpenGL context can be
+# created. Each frame is posted and painted with processEvents, so the time
+# includes the flush to the window. The "paint" column is the renderer's own
+# paint time (AnalogClock.frame_ms), which Settings shows as well.
+#
+#   python benchmarks/clock_paint.py --verify-opengl
+#
+# Renders the raster and OpenGL clocks at the same fixed time and compares the
+# pixels, both on the first frame and after a run of frames that reuse the face
+# texture. Exit status is 1 when they differ or no OpenGL context is available;
+# run it on real drivers before enabling the OpenGL clock (--opengl-clock).
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtGui import QImage
+from PySide6.QtWidgets import QApplication
+
+from stats import p95
+
+VERIFY_ANGLES = {"hour": 307.5, "minute": 45.0, "second": 200.0}
+
+
+def full_update(clock):
+    import Timer
+
+    clock.angles = Timer.hand_angles()
+    clock.update()
+
+
+def dirty_update(clock):
+    clock.advance_hands()
+
+
+def measure(app, clock, step, frames):
+    samples = []
+    for _ in range(frames):
+        start = time.perf_counter()
+        step(clock)
+        app.processEvents()
+        samples.append((time.perf_counter() - start) * 1000)
+        time.sleep(0.004)  # Let the second hand move a little between frames
+    return samples
+
+
+def grab_at(app, clock, angles):
+    clock.angles = dict(angles)
+    clock.update()
+    app.processEvents()
+    return clock.grab().toImage().convertToFormat(QImage.Format_RGB32)
+
+
+def differing_pixels(first, second, tolerance=48):
+    """Fraction of pixels where any channel differs by more than ``tolerance``."""
+    if first.size() != second.size():
+        return 1.0
+    a, b = bytes(first.constBits()), bytes(second.constBits())
+    differing = sum(
+        1 for i in range(0, len(a), 4)
+        if max(abs(a[i] - b[i]), abs(a[i + 1] - b[i + 1]), abs(a[i + 2] - b[i + 2])) > tolerance
+    )
+    return differing / (len(a) // 4)
+
+
+def verify_opengl(app, size, frames, max_differing=0.005):
+    """Compare GLAnalogClock with AnalogClock pixel by pixel; True when they agree."""
+    import Timer
+
+    if not Timer.opengl_available():
+        print("OpenGL is not available here; nothing was verified")
+        return False
+    images = {}
+    for renderer in ("raster", "opengl"):
+        clock = Timer.make_clock(renderer)
+        Timer.FrameScheduler.instance().pause(clock.frame_sub)
+        clock.resize(size, size)
+        clock.show()
+        first = grab_at(app, clock, VERIFY_ANGLES)
+        measure(app, clock, dirty_update, frames)  # Repaints with the cached face
+        images[renderer] = (first, grab_at(app, clock, VERIFY_ANGLES))
+        print(f"{renderer:<7} paint mean {clock.frame_ms():.3f} ms over {len(clock.frame_times)} frames")
+        clock.close()
+
+    ok = True
+    for index, label in enumerate(("first frame", f"after {frames} frames")):
+        fraction = differing_pixels(images["raster"][index], images["opengl"][index])
+        ok &= fraction <= max_differing
+        print(f"{label:<18} {fraction:7.2%} of pixels differ   {'ok' if fraction <= max_differing else 'MISMATCH'}")
+    if not ok:
+        images["raster"][1].save("clock_raster.png")
+        images["opengl"][1].save("clock_opengl.png")
+        print("Saved clock_raster.png and clock_opengl.png for inspection")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Analog clock frame cost")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[300, 600, 1200])
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--verify-opengl", action="store_true", help="compare OpenGL output with raster")
+    args = parser.parse_args()
+
+    import Timer
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    if args.verify_opengl:
+        sys.exit(0 if verify_opengl(app, args.sizes[0], args.frames) else 1)
+    modes = [("raster full", "raster", full_update), ("raster dirty", "raster", dirty_update)]
+    if Timer.opengl_available():
+        modes.append(("opengl", "opengl", dirty_update))
+    else:
+        print("OpenGL is not available here; only the raster renderer is measured")
+
+    print(f"{'size':>6}  {'renderer':<14}{'frame mean':>13}{'frame p95':>13}{'paint mean':>13}")
+    for size in args.sizes:
+        for name, renderer, step in modes:
+            clock = Timer.make_clock(renderer)
+            Timer.FrameScheduler.instance().pause(clock.frame_sub)  # Frames come from this loop only
+            clock.resize(size, size)
+            clock.show()
+            app.processEvents()
+            clock.frame_times.clear()
+            samples = measure(app, clock, step, args.frames)
+            print(f"{size:>6}  {name:<14}{statistics.mean(samples):>10.3f} ms{p95(samples):>10.3f} ms{clock.frame_ms():>10.3f} ms")
+            clock.close()
+
+
+if __name__ == "__main__":
+    main()
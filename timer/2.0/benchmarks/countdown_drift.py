@@ -0,0 +1,91 @@
+# countdown_drift.py
+# Measures how late a countdown finishes while the event loop is being stalled.
+#
+#   python benchmarks/countdown_drift.py --seconds 30 --stall-ms 250
+#
+# Runs the legacy "decrement on every 1000 ms tick" loop next to the real
+# CountdownTimer widget (deadline based) and prints the drift of each.
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QApplication
+from PySide6.QtCore import QTimer, QEventLoop
+
+
+class LegacyCountdown:
+    """The pre-engine behaviour: one second is removed per QTimer timeout."""
+
+    def __init__(self, seconds, on_done):
+        self.remaining_secs = seconds
+        self.on_done = on_done
+        self.timer = QTimer()
+        self.timer.timeout.connect(self._tick)
+        self.timer.start(1000)
+
+    def _tick(self):
+        self.remaining_secs -= 1
+        if self.remaining_secs <= 0:
+            self.timer.stop()
+            self.on_done()
+
+
+def stall_event_loop(max_stall_ms, rng):
+    """Block the GUI thread like a heavy repaint or a slow slot would."""
+    time.sleep(rng.uniform(0, max_stall_ms) / 1000)
+
+
+def run(seconds, stall_ms, stall_every_ms, seed):
+    import Timer
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    rng = random.Random(seed)
+    finished = {}
+    loop = QEventLoop()
+
+    def done(name):
+        finished[name] = time.monotonic()
+        if len(finished) == 2:
+            loop.quit()
+
+    # The widget would open a modal box at expiry; record the moment instead
+    Timer.QMessageBox.information = lambda *args: done("engine")
+
+    widget = Timer.CountdownTimer()
+    widget.s_spin.setValue(seconds % 60)
+    widget.m_spin.setValue(seconds // 60 % 60)
+    widget.h_spin.setValue(seconds // 3600)
+
+    stall_timer = QTimer()
+    stall_timer.timeout.connect(lambda: stall_event_loop(stall_ms, rng))
+
+    start = time.monotonic()
+    legacy = LegacyCountdown(seconds, lambda: done("legacy"))
+    widget.start_timer()
+    stall_timer.start(stall_every_ms)
+    loop.exec()
+    stall_timer.stop()
+
+    return {name: (at - start - seconds) * 1000 for name, at in finished.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Countdown drift under event-loop stalls")
+    parser.add_argument("--seconds", type=int, default=10, help="countdown length")
+    parser.add_argument("--stall-ms", type=float, default=200, help="longest single event-loop stall")
+    parser.add_argument("--stall-every-ms", type=int, default=300, help="interval between stalls")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    results = run(args.seconds, args.stall_ms, args.stall_every_ms, args.seed)
+    for name in ("legacy", "engine"):
+        print(f"{name:<8} drift: {results[name]:+9.1f} ms over {args.seconds} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+# startup_budget.py
+# Launches Timer.py with --profile-startup a few times and fails if startup is over budget.
+#
+#   python benchmarks/startup_budget.py
+#   python benchmarks/startup_budget.py --runs 9 --budget benchmarks/startup_budget.json
+#
+# The budget file holds the allowed median "first_paint_ms" and "import_total_ms".
+# Exit status is 1 when either median is over, so the script can gate CI;
+# tests/test_startup_budget.py runs the same check with the test suite.
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+APP_DIR = os.path.dirname(HERE)
+DEFAULT_BUDGET = os.path.join(HERE, "startup_budget.json")
+METRICS = ("first_paint_ms", "import_total_ms")
+
+
+def profile_once(report_path, budget_ms):
+    env = dict(os.environ)
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    command = [
+        sys.executable, "Timer.py", f"--profile-startup={report_path}", f"--startup-budget-ms={budget_ms}",
+        f"--journal-dir={os.path.dirname(report_path)}",  # Never touch the user's real session
+    ]
+    subprocess.run(command, cwd=APP_DIR, env=env, timeout=60, stdout=subprocess.DEVNULL)
+    with open(report_path, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def load_budget(path=DEFAULT_BUDGET):
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def measure(budget, runs=None):
+    """Launch the app ``runs`` times; return the median of each budgeted metric and the reports."""
+    reports = []
+    with tempfile.TemporaryDirectory() as folder:
+        for i in range(runs or budget.get("runs", 5)):
+            reports.append(profile_once(os.path.join(folder, f"run{i}.json"), budget["first_paint_ms"]))
+    medians = {key: statistics.median(report[key] for report in reports) for key in METRICS}
+    return medians, reports
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Startup time budget check")
+    parser.add_argument("--budget", default=DEFAULT_BUDGET)
+    parser.add_argument("--runs", type=int, help="overrides the budget file")
+    parser.add_argument("--top", type=int, default=8, help="slowest imports to list")
+    args = parser.parse_args()
+
+    budget = load_budget(args.budget)
+    medians, reports = measure(budget, args.runs)
+
+    failed = False
+    for key, median in medians.items():
+        over = median > budget[key]
+        failed |= over
+        print(f"{key:<16} median {median:8.1f} ms   budget {budget[key]:8.1f} ms   {'OVER' if over else 'ok'}")
+
+    print("pages (last run):", ", ".join(f"{name} {ms:.1f} ms" for name, ms in reports[-1]["pages_ms"].items()))
+    print("slowest imports (self time, last run):")
+    for entry in reports[-1]["imports"][:args.top]:
+        print(f"  {entry['module']:<28} {entry['self_ms']:8.2f} ms   ({entry['inclusive_ms']:.2f} ms inclusive)")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,9 @@
+# stats.py
+# Summary statistics shared by the benchmark scripts
+from math import ceil
+
+
+def p95(samples):
+    """Nearest-rank 95th percentile: the ceil(0.95 * n)-th smallest sample."""
+    ordered = sorted(samples)
+    return ordered[max(1, ceil(0.95 * len(ordered))) - 1]
@@ -0,0 +1,230 @@
+# suite.py
+# Runs the headless benchmarks together and compares them with a saved JSON baseline.
+#
+#   python benchmarks/suite.py --save-baseline       # on a known-good build
+#   python benchmarks/suite.py                       # after a change or upgrade
+#   python benchmarks/suite.py --only clock_paint stopwatch --threshold 0.1
+#
+# Every metric is a time in ms where lower is better. A metric regresses when
+# it is more than --threshold (relative) over the baseline AND more than the
+# case's noise floor (absolute) over it, so sub-millisecond jitter does not
+# trip it. Per-call costs are medians, and each case runs --repeat times with
+# the best value of every metric kept, so background load on the machine does
+# not read as a regression. Exit status is 1 when anything regressed. Baselines are machine
+# specific: save one on the machine that will run the comparison.
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6 import __version__ as PYSIDE_VERSION
+from PySide6.QtWidgets import QApplication, QMainWindow
+
+import clock_paint
+import countdown_drift
+import startup_budget
+import theme_switch
+from stats import p95
+
+DEFAULT_BASELINE = os.path.join(HERE, "baseline.json")
+
+
+def main_window():
+    import Timer
+
+    window = QMainWindow()
+    widget = Timer.CountdownTimer()
+    window.setCentralWidget(widget)
+    window.resize(350, 610)
+    window.show()
+    return window, widget
+
+
+# ---------- Cases: each returns {metric: ms} ----------
+def bench_clock_paint(app, quick):
+    """Raster clock frame (post + paint + flush) and paint-only time at several sizes."""
+    import Timer
+
+    results = {}
+    for size in (300, 600, 1200):
+        clock = Timer.make_clock("raster")
+        Timer.FrameScheduler.instance().pause(clock.frame_sub)  # Frames come from this loop only
+        clock.resize(size, size)
+        clock.show()
+        app.processEvents()
+        clock.frame_times.clear()
+        samples = clock_paint.measure(app, clock, clock_paint.dirty_update, 60 if quick else 300)
+        results[f"{size}px.frame_median"] = statistics.median(samples)
+        results[f"{size}px.frame_p95"] = p95(samples)
+        results[f"{size}px.paint_mean"] = clock.frame_ms()
+        clock.close()
+    return results
+
+
+def bench_stopwatch(app, quick):
+    """Stopwatch.update_display and record_lap as the lap list grows."""
+    results = {}
+    calls = 50 if quick else 200
+    for laps in (0, 1_000, 100_000):
+        window, widget = main_window()
+        stopwatch = widget.stopwatch_page
+        widget.show_page("stopwatch")
+        stopwatch.lap_model.load(range(1000, (laps + 1) * 1000, 1000))
+        stopwatch.last_lap_time = laps * 1000
+        stopwatch.start()
+        app.processEvents()
+
+        display, lap = [], []
+        for _ in range(calls):
+            time.sleep(0.001)  # So each update has a new value to show
+            start = time.perf_counter()
+            stopwatch.update_display()
+            app.processEvents()
+            display.append((time.perf_counter() - start) * 1000)
+        for _ in range(calls):
+            start = time.perf_counter()
+            stopwatch.record_lap()
+            app.processEvents()
+            lap.append((time.perf_counter() - start) * 1000)
+
+        results[f"{laps}_laps.update_display_median"] = statistics.median(display)
+        results[f"{laps}_laps.record_lap_median"] = statistics.median(lap)
+        results[f"{laps}_laps.record_lap_p95"] = p95(lap)
+        stopwatch.reset()
+        window.close()
+    return results
+
+
+def mode_switch(widget, theme):
+    if theme == "dark":
+        widget.apply_dark_mode()
+    else:
+        widget.apply_light_mode()
+
+
+def bench_theme(app, quick):
+    """CountdownTimer.apply_dark_mode / apply_light_mode, including re-polish and repaint."""
+    window, widget = main_window()
+    app.processEvents()
+    samples = theme_switch.measure(app, widget, mode_switch, 10 if quick else 40)
+    window.close()
+    return {"switch_median": statistics.median(samples), "switch_p95": p95(samples)}
+
+
+def bench_startup(app, quick):
+    """Median first paint and import time of a fresh Timer.py process."""
+    runs = 2 if quick else 5
+    with tempfile.TemporaryDirectory() as folder:
+        reports = [startup_budget.profile_once(os.path.join(folder, f"run{i}.json"), 60_000) for i in range(runs)]
+    return {key: statistics.median(report[key] for report in reports)
+            for key in ("first_paint_ms", "import_total_ms")}
+
+
+def bench_drift(app, quick):
+    """How late the countdown finishes while the event loop is stalled (absolute)."""
+    results = countdown_drift.run(3 if quick else 10, 100, 300, seed=1)
+    return {"engine_abs": abs(results["engine"])}
+
+
+# name: (function, noise floor in ms)
+CASES = {
+    "clock_paint": (bench_clock_paint, 0.05),
+    "stopwatch": (bench_stopwatch, 0.05),
+    "theme": (bench_theme, 0.5),
+    "startup": (bench_startup, 25.0),
+    "drift": (bench_drift, 20.0),
+}
+
+
+def run(names, quick, repeat):
+    app = QApplication.instance() or QApplication(sys.argv)
+    metrics = {}
+    for name in names:
+        function, _ = CASES[name]
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for metric, value in function(app, quick).items():
+                key = f"{name}.{metric}"
+                metrics[key] = round(min(value, metrics.get(key, value)), 4)
+        print(f"{name:<12} done in {time.perf_counter() - start:.1f} s", file=sys.stderr)
+    return {
+        "python": sys.version.split()[0],
+        "pyside": PYSIDE_VERSION,
+        "platform": platform.platform(),
+        "quick": quick,
+        "repeat": repeat,
+        "metrics": metrics,
+    }
+
+
+def compare(metrics, baseline, threshold):
+    """Print every metric against the baseline; return the names that regressed."""
+    regressed = []
+    print(f"{'metric':<44}{'baseline':>12}{'now':>12}{'change':>9}")
+    for metric, value in metrics.items():
+        old = baseline.get(metric)
+        if old is None:
+            print(f"{metric:<44}{'--':>12}{value:>12.3f}     new")
+            continue
+        change = (value - old) / old if old else 0.0
+        floor = CASES[metric.split(".")[0]][1]
+        worse = value > old * (1 + threshold) and value - old > floor
+        if worse:
+            regressed.append(metric)
+        print(f"{metric:<44}{old:>12.3f}{value:>12.3f}{change:>+8.0%}{'  REGRESSED' if worse else ''}")
+    return regressed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless benchmark suite with baseline comparison")
+    parser.add_argument("--only", nargs="+", choices=CASES, help="cases to run (default: all)")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true", help="store these results as the baseline")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed relative slowdown")
+    parser.add_argument("--output", help="also write the results to this JSON file")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per case; the best of each metric is kept")
+    parser.add_argument("--quick", action="store_true", help="fewer samples, for a smoke run")
+    args = parser.parse_args()
+
+    results = run(args.only or list(CASES), args.quick, args.repeat)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+
+    if args.save_baseline:
+        baseline = {}
+        if args.only and os.path.exists(args.baseline):
+            with open(args.baseline, encoding="utf-8") as file:
+                baseline = json.load(file)  # Keep the cases that were not rerun
+        baseline.update({key: value for key, value in results.items() if key != "metrics"})
+        baseline["metrics"] = {**baseline.get("metrics", {}), **results["metrics"]}
+        with open(args.baseline, "w", encoding="utf-8") as file:
+            json.dump(baseline, file, indent=2)
+        print(f"Saved {len(results['metrics'])} metrics to {args.baseline}")
+        return
+
+    if not os.path.exists(args.baseline):
+        for metric, value in results["metrics"].items():
+            print(f"{metric:<44}{value:>12.3f}")
+        print(f"No baseline at {args.baseline}; run with --save-baseline to create one")
+        return
+    with open(args.baseline, encoding="utf-8") as file:
+        baseline = json.load(file)
+    if baseline.get("pyside") != results["pyside"] or baseline.get("python") != results["python"]:
+        print(f"Baseline was taken with Python {baseline.get('python')} / PySide6 {baseline.get('pyside')}")
+    regressed = compare(results["metrics"], baseline["metrics"], args.threshold)
+    if regressed:
+        print(f"{len(regressed)} metric(s) regressed by more than {args.threshold:.0%}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
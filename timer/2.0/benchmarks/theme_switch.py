@@ -0,0 +1,79 @@
+# theme_switch.py
+# Measures how long a dark <-> light theme switch takes, including re-polish and repaint.
+#
+#   python benchmarks/theme_switch.py --switches 50
+#
+# "legacy" replays the old per-page / per-button setStyleSheet sequence against
+# the same widget tree; "cached" is CountdownTimer.apply_theme.
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QApplication, QMainWindow
+
+from stats import p95
+
+
+def legacy_switch(widget, theme):
+    import Timer
+
+    style = Timer.get_dark_style() if theme == "dark" else Timer.get_light_style()
+    icon_style = Timer.ICON_BUTTON_STYLE.format(
+        background=Timer.THEMES[theme][1], hover=Timer.THEMES[theme][2]
+    ).replace("#iconButton", "")
+    widget.setStyleSheet(style)
+    widget.settings_page.setStyleSheet(style)
+    widget.stopwatch_page.setStyleSheet(style)
+    for button in (widget.setting_btn, widget.stopwatch_btn, widget.timers_btn,
+                   widget.stopwatch_page.main_timer_btn, widget.stopwatch_page.setting_btn):
+        button.setStyleSheet(icon_style)
+
+
+def cached_switch(widget, theme):
+    widget.apply_theme(theme)
+
+
+def measure(app, widget, switch, switches):
+    samples = []
+    for i in range(switches):
+        theme = "dark" if i % 2 == 0 else "light"
+        start = time.perf_counter()
+        switch(widget, theme)
+        app.processEvents()  # Include the deferred polish and repaint
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def run(switches):
+    import Timer
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    results = {}
+    for name, switch in (("legacy", legacy_switch), ("cached", cached_switch)):
+        window = QMainWindow()
+        widget = Timer.CountdownTimer()
+        window.setCentralWidget(widget)
+        window.resize(350, 610)
+        window.show()
+        app.processEvents()
+        results[name] = measure(app, widget, switch, switches)
+        window.close()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Theme switch latency")
+    parser.add_argument("--switches", type=int, default=40)
+    args = parser.parse_args()
+
+    for name, samples in run(args.switches).items():
+        print(f"{name:<7} mean {statistics.mean(samples):7.2f} ms   p95 {p95(samples):7.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# time_format.py
+# Per-tick cost of turning times into label text: the old QTime/datetime paths against timefmt.
+#
+#   python benchmarks/time_format.py --ticks 20000
+#
+# Each case replays --ticks updates 8 ms apart (125 Hz) into a real QLabel, so
+# the numbers include setText, and the format-only numbers show the string
+# building on its own.
+import argparse
+import datetime
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import QTime
+from PySide6.QtWidgets import QApplication, QLabel
+
+from timefmt import TimeLabel, format_hms, format_ms, format_time_of_day
+
+TICK_MS = 8
+
+
+def legacy_countdown(ms):
+    return QTime(0, 0).addSecs(-(-ms // 1000)).toString("hh:mm:ss")
+
+
+def legacy_stopwatch(ms):
+    return QTime(0, 0).addMSecs(ms).toString("hh:mm:ss:zzz")
+
+
+def legacy_clock(ms):
+    return f"Time: {datetime.datetime.now().strftime('%H:%M:%S')}"
+
+
+# name: (old formatting, value the new code shows for a tick, new formatter)
+CASES = {
+    "countdown hh:mm:ss": (legacy_countdown, lambda ms: -(-ms // 1000), format_hms),
+    "stopwatch hh:mm:ss:zzz": (legacy_stopwatch, lambda ms: ms, format_ms),
+    "wall clock": (legacy_clock, lambda ms: int(time.time()), lambda value: "Time: " + format_time_of_day(value)),
+}
+
+
+def per_tick_us(ticks, update):
+    start = time.perf_counter_ns()
+    for tick in range(ticks):
+        update(10_000_000 + tick * TICK_MS)
+    return (time.perf_counter_ns() - start) / ticks / 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time formatting cost per tick")
+    parser.add_argument("--ticks", type=int, default=20000)
+    args = parser.parse_args()
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    print(f"{'us per tick':<24}{'legacy':>10}{'timefmt':>10}{'format only: legacy':>22}{'timefmt':>10}")
+    for name, (legacy, value_of, formatter) in CASES.items():
+        label = QLabel()
+        legacy_us = per_tick_us(args.ticks, lambda ms: label.setText(legacy(ms)))
+        text = TimeLabel(QLabel(), formatter)
+        new_us = per_tick_us(args.ticks, lambda ms: text.show(value_of(ms)))
+        legacy_format_us = per_tick_us(args.ticks, legacy)
+        format_us = per_tick_us(args.ticks, lambda ms: formatter(value_of(ms)))
+        print(f"{name:<24}{legacy_us:>10.2f}{new_us:>10.2f}{legacy_format_us:>22.2f}{format_us:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+# world_clock.py
+# Per-tick cost of showing many time zones: a tz database lookup per zone against cached offsets.
+#
+#   python benchmarks/world_clock.py --zones 600 --ticks 200
+import argparse
+import os
+import sys
+import time
+from datetime import datetime
+from zoneinfo import ZoneInfo, available_timezones
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from timefmt import format_hms
+from worldclock import WorldClock
+
+
+def lookup_tick(zones):
+    return [datetime.now(tz).strftime("%H:%M:%S") for tz in zones]
+
+
+def cached_tick(engine):
+    engine.refresh()
+    return [format_hms(engine.local_seconds(zone)) for zone in engine.zones]
+
+
+def per_tick_ms(ticks, tick):
+    start = time.perf_counter()
+    for _ in range(ticks):
+        tick()
+    return (time.perf_counter() - start) / ticks * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="World clock tick cost")
+    parser.add_argument("--zones", type=int, default=600)
+    parser.add_argument("--ticks", type=int, default=200)
+    args = parser.parse_args()
+
+    keys = sorted(available_timezones())[:args.zones]
+    zones = [ZoneInfo(key) for key in keys]
+    start = time.perf_counter()
+    engine = WorldClock()
+    for key in keys:
+        engine.add(key)
+    setup_ms = (time.perf_counter() - start) * 1000
+
+    print(f"{len(keys)} zones, transitions precomputed in {setup_ms:.1f} ms")
+    print(f"tz lookup per zone  {per_tick_ms(args.ticks, lambda: lookup_tick(zones)):8.3f} ms per tick")
+    print(f"cached offsets      {per_tick_ms(args.ticks, lambda: cached_tick(engine)):8.3f} ms per tick")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+# journal.py
+# Append-only journal of timer state transitions, compacted into a snapshot on startup
+import json
+import os
+import time
+
+BOOT_TOLERANCE_MS = 5000  # Anchors further apart than this come from another boot
+
+
+def empty_state():
+    return {
+        "countdown": {"state": "idle", "remaining_ms": 0},
+        "stopwatch": {"state": "idle", "accumulated_ms": 0, "laps": []},
+    }
+
+
+def anchors():
+    """Wall and monotonic timestamps taken together, to measure time across restarts."""
+    wall_ms = time.time_ns() // 1_000_000
+    mono_ns = time.monotonic_ns()
+    return {"wall_ms": wall_ms, "mono_ns": mono_ns, "boot_ms": wall_ms - mono_ns // 1_000_000}
+
+
+def elapsed_since(anchor):
+    """Milliseconds since ``anchor``, on the monotonic clock when it is the same boot."""
+    now = anchors()
+    if abs(now["boot_ms"] - anchor["boot_ms"]) <= BOOT_TOLERANCE_MS:
+        return max(0, (now["mono_ns"] - anchor["mono_ns"]) // 1_000_000)
+    return max(0, now["wall_ms"] - anchor["wall_ms"])
+
+
+def apply_event(state, event):
+    """Fold one journal event into ``state`` (in place)."""
+    kind = event["ev"]
+    if event["t"] == "countdown":
+        countdown = state["countdown"]
+        if kind == "start":
+            countdown.update(state="running", remaining_ms=event["remaining_ms"], anchor=event["anchor"])
+        elif kind == "pause":
+            countdown.update(state="paused", remaining_ms=event["remaining_ms"])
+            countdown.pop("anchor", None)
+        elif kind == "reset":
+            state["countdown"] = empty_state()["countdown"]
+    elif event["t"] == "stopwatch":
+        stopwatch = state["stopwatch"]
+        if kind == "start":
+            stopwatch.update(state="running", accumulated_ms=event["accumulated_ms"], anchor=event["anchor"])
+        elif kind == "pause":
+            stopwatch.update(state="paused", accumulated_ms=event["accumulated_ms"])
+            stopwatch.pop("anchor", None)
+        elif kind == "lap":
+            stopwatch["laps"].append(event["total_ms"])
+        elif kind == "reset":
+            state["stopwatch"] = empty_state()["stopwatch"]
+    return state
+
+
+class SessionJournal:
+    """Durable record of countdown and stopwatch transitions.
+
+    Every event is appended to ``session.journal`` as one JSON line and handed
+    to the OS straight away, which survives the process being killed. fsync,
+    which also survives power loss, is batched to at most once per
+    ``fsync_interval`` seconds; call ``sync()`` periodically to flush the tail.
+    ``restore()`` replays the journal over the last snapshot, writes a fresh
+    snapshot and truncates the journal, so startup cost stays flat.
+
+    Events are numbered and the snapshot stores the number of the last event
+    it contains. Replay skips events at or below it, so a crash after the
+    snapshot is written but before the journal is truncated cannot apply the
+    same laps twice.
+    """
+
+    def __init__(self, folder, fsync_interval=1.0):
+        os.makedirs(folder, exist_ok=True)
+        self.journal_path = os.path.join(folder, "session.journal")
+        self.snapshot_path = os.path.join(folder, "session.snapshot.json")
+        self.fsync_interval = fsync_interval
+        self._file = None
+        self._seq = 0  # Number of the last event recorded or folded into the snapshot
+        self._dirty = False
+        self._last_fsync = time.monotonic()
+
+    def restore(self):
+        """Rebuild the last known state and compact it into the snapshot."""
+        state = empty_state()
+        try:
+            with open(self.snapshot_path, encoding="utf-8") as file:
+                state = json.load(file)
+        except (OSError, ValueError):
+            pass
+        self._seq = state.pop("seq", 0)
+
+        try:
+            with open(self.journal_path, encoding="utf-8") as file:
+                for line in file:
+                    try:
+                        event = json.loads(line)
+                        seq = event.get("n", self._seq + 1)
+                        if seq > self._seq:  # Older events are already in the snapshot
+                            apply_event(state, event)
+                            self._seq = seq
+                    except (ValueError, KeyError, AttributeError):
+                        break  # A torn final write from a crash; nothing valid follows
+        except OSError:
+            pass
+
+        self._compact(state)
+        return state
+
+    def _compact(self, state):
+        tmp_path = self.snapshot_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            json.dump({**state, "seq": self._seq}, file, separators=(",", ":"))
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_path, self.snapshot_path)
+        # Events up to self._seq are now in the snapshot, and replay skips them
+        # even if the truncation below never happens.
+        # Truncate, then append: a handle in "w" mode would keep writing at its
+        # old offset if the file were truncated again, padding it with NULs.
+        if self._file is not None:
+            self._file.close()
+        open(self.journal_path, "w", encoding="utf-8").close()
+        self._file = open(self.journal_path, "a", encoding="utf-8")
+
+    def record(self, timer, event, **fields):
+        if self._file is None:
+            self._file = open(self.journal_path, "a", encoding="utf-8")
+        self._seq += 1
+        self._file.write(json.dumps({"n": self._seq, "t": timer, "ev": event, **fields}, separators=(",", ":")) + "\n")
+        self._file.flush()
+        self._dirty = True
+        if time.monotonic() - self._last_fsync >= self.fsync_interval:
+            self.sync()
+
+    def sync(self):
+        if self._dirty and self._file is not None:
+            os.fsync(self._file.fileno())
+            self._dirty = False
+            self._last_fsync = time.monotonic()
+
+    def close(self):
+        if self._file is not None:
+            self.sync()
+            self._file.close()
+            self._file = None
@@ -0,0 +1,142 @@
+# lapexport.py
+# Streams laps to disk from a background thread so the GUI never waits on I/O
+import csv
+import json
+import os
+import queue
+import struct
+import sys
+import threading
+import time
+from array import array
+
+FIELDS = ("index", "split_ms", "total_ms", "timestamp_ms")
+EXTENSIONS = {"csv": ".csv", "jsonl": ".jsonl", "columnar": ".lapcol"}
+
+COLUMNAR_MAGIC = b"LAPCOL1\n"
+_BLOCK_HEADER = struct.Struct("<I")  # Rows in the block that follows
+
+
+class _CsvWriter:
+    def __init__(self, path):
+        is_new = not os.path.exists(path) or os.path.getsize(path) == 0
+        self.file = open(path, "a", newline="", encoding="utf-8")
+        self.writer = csv.writer(self.file)
+        if is_new:
+            self.writer.writerow(FIELDS)
+
+    def write_batch(self, rows):
+        self.writer.writerows(rows)
+
+
+class _JsonlWriter:
+    def __init__(self, path):
+        self.file = open(path, "a", encoding="utf-8")
+
+    def write_batch(self, rows):
+        self.file.write("".join(json.dumps(dict(zip(FIELDS, row))) + "\n" for row in rows))
+
+
+class _ColumnarWriter:
+    """One block per batch: a row count, then each column as little-endian int64."""
+
+    def __init__(self, path):
+        is_new = not os.path.exists(path) or os.path.getsize(path) == 0
+        self.file = open(path, "ab")
+        if is_new:
+            self.file.write(COLUMNAR_MAGIC)
+
+    def write_batch(self, rows):
+        self.file.write(_BLOCK_HEADER.pack(len(rows)))
+        for column in zip(*rows):
+            values = array("q", column)
+            if sys.byteorder != "little":
+                values.byteswap()
+            self.file.write(values.tobytes())
+
+
+_WRITERS = {"csv": _CsvWriter, "jsonl": _JsonlWriter, "columnar": _ColumnarWriter}
+
+
+def read_columnar(path):
+    """Yield each block of a columnar lap file as a dict of array('q') columns."""
+    with open(path, "rb") as file:
+        if file.read(len(COLUMNAR_MAGIC)) != COLUMNAR_MAGIC:
+            raise ValueError(f"{path} is not a columnar lap file")
+        while header := file.read(_BLOCK_HEADER.size):
+            (rows,) = _BLOCK_HEADER.unpack(header)
+            block = {}
+            for name in FIELDS:
+                values = array("q")
+                values.frombytes(file.read(rows * values.itemsize))
+                if sys.byteorder != "little":
+                    values.byteswap()
+                block[name] = values
+            yield block
+
+
+class LapExporter:
+    """Appends laps to a CSV, JSONL or columnar file from a writer thread.
+
+    ``write_lap`` only puts a tuple on a queue. The thread collects rows into
+    batches of up to ``batch_size`` (or whatever arrived within
+    ``flush_interval`` seconds) and writes and flushes each batch at once.
+    If a write fails (disk full, drive removed) the thread closes the file
+    and stops, and the error is raised by the next ``write_lap`` or ``close``.
+    """
+
+    def __init__(self, path, fmt="csv", batch_size=256, flush_interval=1.0):
+        if fmt not in _WRITERS:
+            raise ValueError(f"Unknown lap export format: {fmt}")
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue = queue.SimpleQueue()
+        self._error = None  # Set by the writer thread when it gave up
+        self._writer = _WRITERS[fmt](path)  # Opened here so errors reach the caller
+        self._thread = threading.Thread(target=self._run, name="LapExporter", daemon=True)
+        self._thread.start()
+
+    def write_lap(self, index, split_ms, total_ms, timestamp_ms):
+        self._raise_error()
+        self._queue.put((index, split_ms, total_ms, timestamp_ms))
+
+    def close(self):
+        """Write everything still queued, then stop the thread and close the file."""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        self._raise_error()
+
+    def _raise_error(self):
+        if self._error is not None:
+            raise self._error
+
+    def _run(self):
+        try:
+            done = False
+            while not done:
+                item = self._queue.get()
+                batch = []
+                deadline = time.monotonic() + self.flush_interval
+                while item is not None:
+                    batch.append(item)
+                    timeout = deadline - time.monotonic()
+                    if len(batch) >= self.batch_size or timeout <= 0:
+                        break
+                    try:
+                        item = self._queue.get(timeout=timeout)
+                    except queue.Empty:
+                        break
+                else:
+                    done = True
+                if batch:
+                    self._writer.write_batch(batch)
+                    self._writer.file.flush()
+        except Exception as e:  # Reported to the GUI thread instead of dying silently
+            self._error = e
+        finally:
+            try:
+                self._writer.file.close()
+            except OSError as e:  # Flushing the rest can fail the same way
+                self._error = self._error or e
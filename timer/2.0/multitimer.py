@@ -0,0 +1,118 @@
+# multitimer.py
+# Many named countdowns sharing one deadline heap (and therefore one OS timer)
+import heapq
+import itertools
+import time
+
+from core.clock import NS_PER_MS, NS_PER_SEC
+
+RUNNING = "running"
+PAUSED = "paused"
+DONE = "done"
+
+
+class NamedTimer:
+    __slots__ = ("name", "duration_ns", "deadline_ns", "remaining_ns", "state", "generation")
+
+    def __init__(self, name, duration_ns):
+        self.name = name
+        self.duration_ns = duration_ns
+        self.deadline_ns = 0
+        self.remaining_ns = duration_ns  # Frozen value while paused or done
+        self.state = PAUSED
+        self.generation = 0  # Bumped whenever older heap entries become stale
+
+
+class MultiTimerEngine:
+    """Thousands of concurrent countdowns ordered by deadline in a min-heap.
+
+    Only the earliest deadline matters to the caller, who arms a single timer
+    for ``next_deadline_ns()`` and calls ``pop_expired()`` when it fires.
+    Pausing, resuming or cancelling does not search the heap: the timer's
+    generation is bumped and its outdated heap entry is dropped lazily.
+    """
+
+    def __init__(self, clock=time.monotonic_ns):
+        self._clock = clock
+        self._heap = []  # (deadline_ns, seq, generation, NamedTimer)
+        self._seq = itertools.count()
+        self.timers = []  # Insertion order, used for list rows
+        self._by_name = {}
+
+    def __len__(self):
+        return len(self.timers)
+
+    def __contains__(self, name):
+        return name in self._by_name
+
+    def index_of(self, name):
+        return self.timers.index(self._by_name[name])
+
+    def add(self, name, duration_ms, start=True):
+        if name in self._by_name:
+            raise ValueError(f"A timer named {name!r} already exists")
+        timer = NamedTimer(name, max(0, duration_ms) * NS_PER_MS)
+        self.timers.append(timer)
+        self._by_name[name] = timer
+        if start:
+            self.resume(name)
+        return timer
+
+    def pause(self, name):
+        timer = self._by_name[name]
+        if timer.state == RUNNING:
+            timer.remaining_ns = max(0, timer.deadline_ns - self._clock())
+            timer.state = PAUSED
+            timer.generation += 1
+
+    def resume(self, name):
+        timer = self._by_name[name]
+        if timer.state == PAUSED:
+            timer.deadline_ns = self._clock() + timer.remaining_ns
+            timer.state = RUNNING
+            timer.generation += 1
+            heapq.heappush(self._heap, (timer.deadline_ns, next(self._seq), timer.generation, timer))
+
+    def cancel(self, name):
+        timer = self._by_name.pop(name)
+        timer.generation += 1
+        self.timers.remove(timer)
+        return timer
+
+    def remaining_ns(self, timer):
+        if timer.state == RUNNING:
+            return max(0, timer.deadline_ns - self._clock())
+        return timer.remaining_ns
+
+    def remaining_secs(self, timer):
+        return -(-self.remaining_ns(timer) // NS_PER_SEC)
+
+    def _drop_stale(self):
+        heap = self._heap
+        while heap and heap[0][2] != heap[0][3].generation:
+            heapq.heappop(heap)
+
+    def next_deadline_ns(self):
+        """Earliest deadline among running timers, or None when nothing runs."""
+        self._drop_stale()
+        return self._heap[0][0] if self._heap else None
+
+    def ms_until_next_deadline(self):
+        deadline = self.next_deadline_ns()
+        if deadline is None:
+            return None
+        return -(-max(0, deadline - self._clock()) // NS_PER_MS)
+
+    def pop_expired(self):
+        """Mark every timer whose deadline has passed as done and return them."""
+        now = self._clock()
+        expired = []
+        while True:
+            self._drop_stale()
+            if not self._heap or self._heap[0][0] > now:
+                return expired
+            timer = heapq.heappop(self._heap)[3]
+            timer.state = DONE
+            timer.remaining_ns = 0
+            timer.generation += 1
+            expired.append(timer)
@@ -0,0 +1,118 @@
+# startup_profile.py
+# Records where launch time goes: per-module imports, page construction and first paint
+import builtins
+import json
+import os
+import sys
+import time
+
+DEFAULT_REPORT = "startup_profile.json"
+
+
+class StartupProfile:
+    """Collects startup timings and writes them to a JSON report.
+
+    ``install()`` wraps ``__import__`` so every module imported for the first
+    time is timed, both inclusive (with the imports it triggers) and self.
+    Pages and the first paint are reported by the app through ``page_built``
+    and ``first_paint``.
+    """
+
+    def __init__(self, t0, report_path=DEFAULT_REPORT, budget_ms=None):
+        self.t0 = t0
+        self.report_path = report_path
+        self.budget_ms = budget_ms
+        self.imports = {}  # module -> [inclusive_ms, self_ms]
+        self.pages = {}
+        self.import_total_ms = 0.0  # Outermost imports only, so nothing is counted twice
+        self.first_paint_ms = None
+        self._stack = []  # Child import time accumulated for each import in progress
+        self._original_import = None
+
+    # ---------- Imports ----------
+    def install(self):
+        self._original_import = builtins.__import__
+        builtins.__import__ = self._timed_import
+
+    def uninstall(self):
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        if level or name in sys.modules:
+            return self._original_import(name, globals, locals, fromlist, level)
+        self._stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            return self._original_import(name, globals, locals, fromlist, level)
+        finally:
+            inclusive = (time.perf_counter() - start) * 1000
+            children = self._stack.pop()
+            if self._stack:
+                self._stack[-1] += inclusive
+            else:
+                self.import_total_ms += inclusive
+            self.imports[name] = [inclusive, inclusive - children]
+
+    # ---------- App milestones ----------
+    def page_built(self, name, elapsed_ms):
+        self.pages[name] = elapsed_ms
+        if self.first_paint_ms is not None:
+            self.write_report()  # A page opened later in the session
+
+    def first_paint(self):
+        """Record the first paint, write the report, and say whether the budget held."""
+        self.first_paint_ms = (time.perf_counter() - self.t0) * 1000
+        self.uninstall()  # Later imports are not part of startup
+        self.write_report()
+        return self.within_budget()
+
+    def within_budget(self):
+        return self.budget_ms is None or self.first_paint_ms <= self.budget_ms
+
+    # ---------- Report ----------
+    def report(self):
+        imports = sorted(self.imports.items(), key=lambda item: item[1][1], reverse=True)
+        return {
+            "python": sys.version.split()[0],
+            "first_paint_ms": round(self.first_paint_ms, 2) if self.first_paint_ms else None,
+            "budget_ms": self.budget_ms,
+            "within_budget": self.within_budget() if self.first_paint_ms else None,
+            "import_total_ms": round(self.import_total_ms, 2),
+            "pages_ms": {name: round(ms, 2) for name, ms in self.pages.items()},
+            "imports": [
+                {"module": name, "inclusive_ms": round(inclusive, 3), "self_ms": round(own, 3)}
+                for name, (inclusive, own) in imports
+            ],
+        }
+
+    def write_report(self):
+        report = self.report()
+        with open(self.report_path, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+        if sys.stderr:
+            print(
+                f"Startup: first paint {report['first_paint_ms']} ms, imports {report['import_total_ms']} ms, "
+                f"pages {report['pages_ms']} -> {os.path.abspath(self.report_path)}",
+                file=sys.stderr,
+            )
+
+
+def from_argv(argv, t0):
+    """Build a profile when ``--profile-startup[=REPORT]`` is on the command line.
+
+    ``--startup-budget-ms N`` (or ``=N``) sets the first-paint budget; the app
+    then quits after the first paint with exit status 1 if it was exceeded.
+    """
+    profile_arg = next((arg for arg in argv if arg.split("=")[0] == "--profile-startup"), None)
+    if profile_arg is None:
+        return None
+    report_path = profile_arg.partition("=")[2] or DEFAULT_REPORT
+    budget_ms = None
+    for i, arg in enumerate(argv):
+        if arg == "--startup-budget-ms" and i + 1 < len(argv):
+            budget_ms = float(argv[i + 1])
+        elif arg.startswith("--startup-budget-ms="):
+            budget_ms = float(arg.partition("=")[2])
+    return StartupProfile(t0, report_path, budget_ms)
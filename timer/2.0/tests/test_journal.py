@@ -0,0 +1,70 @@
+# test_journal.py
+# SessionJournal replay and compaction, including a crash between the snapshot and the truncation
+import shutil
+
+from journal import SessionJournal
+
+ANCHOR = {"wall_ms": 0, "mono_ns": 0, "boot_ms": 0}
+
+
+def record_laps(journal, *totals):
+    journal.record("stopwatch", "start", accumulated_ms=0, anchor=ANCHOR)
+    for total_ms in totals:
+        journal.record("stopwatch", "lap", total_ms=total_ms)
+    journal.record("stopwatch", "pause", accumulated_ms=totals[-1])
+
+
+def test_restore_replays_the_journal(tmp_path):
+    journal = SessionJournal(tmp_path)
+    journal.restore()
+    record_laps(journal, 1000, 2500)
+    journal.record("countdown", "pause", remaining_ms=4000)
+    journal.close()
+
+    state = SessionJournal(tmp_path).restore()
+    assert state["stopwatch"] == {"state": "paused", "accumulated_ms": 2500, "laps": [1000, 2500]}
+    assert state["countdown"] == {"state": "paused", "remaining_ms": 4000}
+
+
+def test_restore_compacts_into_the_snapshot(tmp_path):
+    journal = SessionJournal(tmp_path)
+    journal.restore()
+    record_laps(journal, 1000)
+    journal.close()
+
+    journal = SessionJournal(tmp_path)
+    journal.restore()
+    journal.close()
+    assert (tmp_path / "session.journal").read_text() == ""
+    assert SessionJournal(tmp_path).restore()["stopwatch"]["laps"] == [1000]
+
+
+def test_crash_before_truncation_does_not_duplicate_laps(tmp_path):
+    journal = SessionJournal(tmp_path)
+    journal.restore()
+    record_laps(journal, 1000, 2500)
+    journal.close()
+    shutil.copy(tmp_path / "session.journal", tmp_path / "old.journal")
+
+    journal = SessionJournal(tmp_path)
+    journal.restore()  # Snapshot written...
+    journal.close()
+    shutil.copy(tmp_path / "old.journal", tmp_path / "session.journal")  # ...but the truncation was lost
+
+    journal = SessionJournal(tmp_path)
+    assert journal.restore()["stopwatch"]["laps"] == [1000, 2500]
+    journal.record("stopwatch", "lap", total_ms=4000)  # Numbering carries on past the snapshot
+    journal.close()
+    assert SessionJournal(tmp_path).restore()["stopwatch"]["laps"] == [1000, 2500, 4000]
+
+
+def test_torn_final_line_is_ignored(tmp_path):
+    journal = SessionJournal(tmp_path)
+    journal.restore()
+    record_laps(journal, 1000)
+    journal.close()
+    with open(tmp_path / "session.journal", "a", encoding="utf-8") as file:
+        file.write('{"n": 99, "t": "stopwatch", "ev": "la')
+
+    state = SessionJournal(tmp_path).restore()
+    assert state["stopwatch"]["laps"] == [1000]
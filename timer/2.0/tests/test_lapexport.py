@@ -0,0 +1,70 @@
+# test_lapexport.py
+# LapExporter output in each format, and a failing writer reporting its error to the caller
+import csv
+import json
+
+import pytest
+
+from lapexport import FIELDS, LapExporter, read_columnar
+
+LAPS = [(1, 1000, 1000, 50), (2, 1500, 2500, 51), (3, 200, 2700, 52)]
+
+
+def export(path, fmt, laps=LAPS, **options):
+    exporter = LapExporter(str(path), fmt, **options)
+    for lap in laps:
+        exporter.write_lap(*lap)
+    exporter.close()
+
+
+def test_csv(tmp_path):
+    path = tmp_path / "laps.csv"
+    export(path, "csv")
+    export(path, "csv", laps=[(4, 300, 3000, 53)])  # Appending keeps a single header
+    with open(path, newline="", encoding="utf-8") as file:
+        rows = list(csv.reader(file))
+    assert rows[0] == list(FIELDS)
+    assert [tuple(map(int, row)) for row in rows[1:]] == LAPS + [(4, 300, 3000, 53)]
+
+
+def test_jsonl(tmp_path):
+    path = tmp_path / "laps.jsonl"
+    export(path, "jsonl")
+    with open(path, encoding="utf-8") as file:
+        rows = [json.loads(line) for line in file]
+    assert rows == [dict(zip(FIELDS, lap)) for lap in LAPS]
+
+
+def test_columnar_in_several_batches(tmp_path):
+    path = tmp_path / "laps.lapcol"
+    export(path, "columnar", batch_size=2)
+    blocks = list(read_columnar(path))
+    assert len(blocks) == 2
+    rows = [lap for block in blocks for lap in zip(*(block[name] for name in FIELDS))]
+    assert rows == LAPS
+
+
+def test_unknown_format(tmp_path):
+    with pytest.raises(ValueError):
+        LapExporter(str(tmp_path / "laps.txt"), "txt")
+
+
+class FullDisk:
+    def __init__(self, file):
+        self.file = file
+
+    def write_batch(self, rows):
+        raise OSError("No space left on device")
+
+
+def test_writer_error_reaches_the_caller(tmp_path):
+    exporter = LapExporter(str(tmp_path / "laps.csv"), "csv", flush_interval=0)
+    exporter._writer = FullDisk(exporter._writer.file)
+    exporter.write_lap(*LAPS[0])
+    exporter._thread.join(5)
+    assert not exporter._thread.is_alive()
+    assert exporter._writer.file.closed
+    with pytest.raises(OSError, match="No space"):
+        exporter.write_lap(*LAPS[1])
+    with pytest.raises(OSError, match="No space"):
+        exporter.close()
@@ -0,0 +1,70 @@
+# test_multitimer.py
+# MultiTimerEngine's deadline heap on a FakeClock, in particular its lazy deletion of stale entries
+from core import FakeClock
+from core.clock import NS_PER_MS
+from multitimer import DONE, PAUSED, RUNNING, MultiTimerEngine
+
+
+def make():
+    clock = FakeClock()
+    return clock, MultiTimerEngine(clock)
+
+
+def test_next_deadline_is_the_earliest():
+    clock, engine = make()
+    engine.add("tea", 3000)
+    engine.add("eggs", 1000)
+    engine.add("pasta", 2000)
+    assert engine.next_deadline_ns() == 1000 * NS_PER_MS
+    assert engine.ms_until_next_deadline() == 1000
+
+
+def test_cancel_drops_the_heap_entry_lazily():
+    clock, engine = make()
+    engine.add("eggs", 1000)
+    engine.add("tea", 3000)
+    engine.cancel("eggs")
+    assert len(engine._heap) == 2  # Still there until it reaches the top
+    assert engine.next_deadline_ns() == 3000 * NS_PER_MS
+    assert len(engine._heap) == 1
+
+
+def test_cancel_then_re_add_the_same_name():
+    clock, engine = make()
+    engine.add("eggs", 1000)
+    engine.cancel("eggs")
+    timer = engine.add("eggs", 5000)
+    assert engine.next_deadline_ns() == 5000 * NS_PER_MS
+
+    clock.advance(ms=1000)
+    assert engine.pop_expired() == []  # The cancelled deadline does not fire the new timer
+    assert timer.state == RUNNING
+    clock.advance(ms=4000)
+    assert engine.pop_expired() == [timer]
+    assert timer.state == DONE
+    assert engine.next_deadline_ns() is None
+
+
+def test_pause_and_resume_move_the_deadline():
+    clock, engine = make()
+    eggs = engine.add("eggs", 1000)
+    engine.add("tea", 3000)
+    clock.advance(ms=400)
+    engine.pause("eggs")
+    assert eggs.state == PAUSED
+    assert engine.next_deadline_ns() == 3000 * NS_PER_MS
+
+    clock.advance(ms=2000)
+    engine.resume("eggs")
+    assert engine.next_deadline_ns() == 3000 * NS_PER_MS  # 2400 + 600 remaining
+    assert engine.remaining_secs(eggs) == 1
+
+
+def test_pop_expired_returns_every_due_timer_in_deadline_order():
+    clock, engine = make()
+    for name, duration_ms in (("c", 300), ("a", 100), ("b", 200), ("d", 400)):
+        engine.add(name, duration_ms)
+    engine.pause("b")
+    clock.advance(ms=300)
+    assert [timer.name for timer in engine.pop_expired()] == ["a", "c"]
+    assert engine.next_deadline_ns() == 400 * NS_PER_MS
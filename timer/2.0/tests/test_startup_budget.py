@@ -0,0 +1,19 @@
+# test_startup_budget.py
+# Fails when the median startup time is over benchmarks/startup_budget.json
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("PySide6")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "benchmarks"))
+
+import startup_budget
+
+
+@pytest.mark.skipif(sys.version_info < (3, 13), reason="Timer.py needs Python 3.13")
+def test_startup_within_budget():
+    budget = startup_budget.load_budget()
+    medians, _ = startup_budget.measure(budget)
+    over = {key: f"{median:.1f} ms > {budget[key]} ms" for key, median in medians.items() if median > budget[key]}
+    assert not over, f"Startup over budget: {over}"
@@ -0,0 +1,49 @@
+# test_worldclock.py
+# WorldClock's cached offsets across a daylight-saving transition, on a fake wall clock
+from worldclock import WorldClock, next_transition, utc_offset
+
+LONDON_SPRING_2026 = 1774746000  # 2026-03-29 01:00 UTC, clocks go forward
+
+
+class FakeWallClock:
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def test_next_transition_is_exact():
+    from zoneinfo import ZoneInfo
+
+    london = ZoneInfo("Europe/London")
+    assert next_transition(london, LONDON_SPRING_2026 - 10 * 86400) == LONDON_SPRING_2026
+    assert utc_offset(london, LONDON_SPRING_2026 - 1) == (0, "GMT")
+    assert utc_offset(london, LONDON_SPRING_2026) == (3600, "BST")
+
+
+def test_refresh_only_updates_zones_at_their_transition():
+    clock = FakeWallClock(LONDON_SPRING_2026 - 60)
+    world = WorldClock(clock)
+    london = world.add("Europe/London")
+    tokyo = world.add("Asia/Tokyo")
+    assert london.offset_text() == "UTC+00:00"
+    assert tokyo.offset_text() == "UTC+09:00"
+
+    clock.now += 59
+    assert world.refresh() == []
+    clock.now += 1
+    assert world.refresh() == [london]
+    assert london.abbreviation == "BST"
+    assert world.local_seconds(london) == 2 * 3600  # 01:00 UTC is 02:00 BST
+
+
+def test_removed_zone_is_dropped_from_the_heap():
+    clock = FakeWallClock(LONDON_SPRING_2026 - 60)
+    world = WorldClock(clock)
+    world.add("Europe/London")
+    world.remove("Europe/London")
+    assert "Europe/London" not in world
+    clock.now += 60
+    assert world.refresh() == []
+    assert world._heap == []
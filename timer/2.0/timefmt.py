@@ -0,0 +1,57 @@
+# timefmt.py
+# Integer durations and clock times to text through lookup tables, and labels that skip unchanged text
+import time
+
+# Every two- and three-digit field rendered once at import, so formatting is lookups and a join
+_TWO_DIGITS = [f"{i:02d}" for i in range(100)]
+_THREE_DIGITS = [f"{i:03d}" for i in range(1000)]
+
+
+def format_hms(seconds):
+    """``hh:mm:ss``; hours keep counting past 24 (and widen past 99) instead of wrapping."""
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    hours_text = _TWO_DIGITS[hours] if hours < 100 else str(hours)
+    return f"{hours_text}:{_TWO_DIGITS[minutes]}:{_TWO_DIGITS[seconds]}"
+
+
+def format_ms(ms):
+    """``hh:mm:ss:zzz``, the stopwatch and lap format, with the same unbounded hours."""
+    seconds, millis = divmod(ms, 1000)  # Inlined rather than calling format_hms: this runs every frame
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    hours_text = _TWO_DIGITS[hours] if hours < 100 else str(hours)
+    return f"{hours_text}:{_TWO_DIGITS[minutes]}:{_TWO_DIGITS[seconds]}:{_THREE_DIGITS[millis]}"
+
+
+def format_time_of_day(timestamp=None):
+    """Local ``HH:MM:SS`` for a Unix timestamp (default now), without a datetime."""
+    local = time.localtime(timestamp)
+    return f"{_TWO_DIGITS[local.tm_hour]}:{_TWO_DIGITS[local.tm_min]}:{_TWO_DIGITS[local.tm_sec]}"
+
+
+class TimeLabel:
+    """Shows an integer time value on a QLabel, doing as little as possible per tick.
+
+    ``show(value)`` returns at once when the value is the one already shown,
+    formats otherwise, and calls ``setText`` only if the text differs (which
+    also spares the label its relayout and repaint). Set the label's text
+    through this object only, or the cached text goes stale.
+    """
+
+    __slots__ = ("label", "formatter", "value", "text")
+
+    def __init__(self, label, formatter):
+        self.label = label
+        self.formatter = formatter
+        self.value = None
+        self.text = None
+
+    def show(self, value):
+        if value == self.value:
+            return
+        self.value = value
+        text = self.formatter(value)
+        if text != self.text:
+            self.text = text
+            self.label.setText(text)
@@ -0,0 +1,122 @@
+# worldclock.py
+# Many time zones at once: each UTC offset is cached until that zone's next transition
+import heapq
+import itertools
+import time
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+SECONDS_PER_DAY = 86400
+SEARCH_STEP = 7 * SECONDS_PER_DAY      # Offsets are sampled a week apart, then bisected
+SEARCH_HORIZON = 400 * SECONDS_PER_DAY  # Zones without a transition this soon are rechecked then
+
+
+def utc_offset(tz, timestamp):
+    """(offset in seconds, abbreviation) of ``tz`` at a Unix timestamp."""
+    local = datetime.fromtimestamp(timestamp, tz)
+    return int(local.utcoffset().total_seconds()), local.tzname()
+
+
+def next_transition(tz, start, step=SEARCH_STEP, horizon=SEARCH_HORIZON):
+    """First whole second after ``start`` at which the offset of ``tz`` changes, or None.
+
+    The offset is sampled every ``step`` seconds and the first change is
+    narrowed down by bisection, about 20 lookups. Two transitions closer
+    together than ``step`` (which no zone currently has) would be missed.
+    """
+    offset = utc_offset(tz, start)[0]
+    low = start
+    end = start + horizon
+    while low < end:
+        high = min(low + step, end)
+        if utc_offset(tz, high)[0] != offset:
+            while high - low > 1:
+                mid = (low + high) // 2
+                if utc_offset(tz, mid)[0] == offset:
+                    low = mid
+                else:
+                    high = mid
+            return high
+        low = high
+    return None
+
+
+class WorldZone:
+    __slots__ = ("key", "tz", "offset", "abbreviation", "valid_until", "removed")
+
+    def __init__(self, key):
+        self.key = key
+        self.tz = ZoneInfo(key)  # Raises ZoneInfoNotFoundError for unknown keys
+        self.offset = 0
+        self.abbreviation = ""
+        self.valid_until = 0
+        self.removed = False
+
+    def offset_text(self):
+        sign = "+" if self.offset >= 0 else "-"
+        hours, minutes = divmod(abs(self.offset) // 60, 60)
+        return f"UTC{sign}{hours:02d}:{minutes:02d}"
+
+
+class WorldClock:
+    """Current time in any number of zones, without a tz database lookup per tick.
+
+    Each zone keeps its UTC offset and the timestamp of its next transition;
+    a min-heap on those timestamps means ``refresh()`` only touches zones
+    whose offset has actually changed, so between transitions local time in
+    a zone is ``now + zone.offset``.
+    """
+
+    def __init__(self, clock=time.time):
+        self._clock = clock
+        self._heap = []  # (valid_until, seq, WorldZone)
+        self._seq = itertools.count()
+        self.zones = []  # Insertion order, used for list rows
+        self._by_key = {}
+        self.now = int(clock())
+
+    def __len__(self):
+        return len(self.zones)
+
+    def __contains__(self, key):
+        return key in self._by_key
+
+    def index_of(self, key):
+        return self.zones.index(self._by_key[key])
+
+    def add(self, key):
+        if key in self._by_key:
+            raise ValueError(f"{key} is already shown")
+        zone = WorldZone(key)
+        self._update(zone, self.now)
+        self.zones.append(zone)
+        self._by_key[key] = zone
+        return zone
+
+    def remove(self, key):
+        zone = self._by_key.pop(key)
+        zone.removed = True  # Its heap entry is dropped when it comes up
+        self.zones.remove(zone)
+        return zone
+
+    def _update(self, zone, now):
+        zone.offset, zone.abbreviation = utc_offset(zone.tz, now)
+        transition = next_transition(zone.tz, now)
+        zone.valid_until = transition if transition is not None else now + SEARCH_HORIZON
+        heapq.heappush(self._heap, (zone.valid_until, next(self._seq), zone))
+
+    def refresh(self):
+        """Advance to the current second and return the zones whose offset changed."""
+        now = self.now = int(self._clock())
+        changed = []
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            zone = heapq.heappop(heap)[2]
+            if not zone.removed:
+                self._update(zone, now)
+                changed.append(zone)
+        return changed
+
+    def local_seconds(self, zone):
+        """Seconds since midnight in ``zone`` at the last refresh."""
+        return (self.now + zone.offset) % SECONDS_PER_DAY
@@ -0,0 +1,7 @@
+# core
+# GUI-free timing shared by the PySide6 (2.0) and tkinter (0.0.2) front ends
+from .clock import FakeClock, hand_angles
+from .countdown import CountdownEngine
+from .laps import LapRecorder
+from .lapstats import LapStatistics
+from .stopwatch import StopwatchEngine
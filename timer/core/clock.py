@@ -0,0 +1,34 @@
+# clock.py
+# Time units, wall-clock hand angles, and a fake monotonic clock for running the engines headless
+import datetime
+
+NS_PER_MS = 1_000_000
+NS_PER_SEC = 1_000_000_000
+
+
+def hand_angles(now=None):
+    """Clockwise angles in degrees of the hour, minute and second hands at ``now``."""
+    if now is None:
+        now = datetime.datetime.now()
+    second = now.second + now.microsecond / 1_000_000
+    minute = now.minute + second / 60
+    hour = now.hour % 12 + minute / 60
+    return {"hour": 30 * hour, "minute": 6 * minute, "second": 6 * second}
+
+
+class FakeClock:
+    """A monotonic nanosecond clock that only moves when told to.
+
+    Pass it as ``clock`` to CountdownEngine or StopwatchEngine to step time
+    exactly, without a display, an event loop or real waiting.
+    """
+
+    def __init__(self, start_ns=0):
+        self.ns = start_ns
+
+    def __call__(self):
+        return self.ns
+
+    def advance(self, ms=0, ns=0):
+        self.ns += ms * NS_PER_MS + ns
+        return self.ns
@@ -0,0 +1,74 @@
+# countdown.py
+# Drift-free countdown: remaining time is always derived from a monotonic deadline
+import time
+
+from .clock import NS_PER_MS, NS_PER_SEC
+
+
+class CountdownEngine:
+    """A countdown that stores a monotonic deadline rather than a tick count.
+
+    Remaining time is recomputed from the deadline whenever it is asked for,
+    so late or missed timer ticks never add up as drift. ``clock`` returns
+    monotonic nanoseconds and can be swapped out for a FakeClock. The
+    remaining-time queries only read the deadline once, so another thread can
+    poll them while the owner starts, pauses or resets the countdown.
+    """
+
+    def __init__(self, clock=time.monotonic_ns):
+        self._clock = clock
+        self._deadline_ns = None  # Set only while running
+        self._remaining_ns = 0    # Frozen value while paused or stopped
+
+    @property
+    def running(self):
+        return self._deadline_ns is not None
+
+    @property
+    def paused(self):
+        return self._deadline_ns is None and self._remaining_ns > 0
+
+    def start(self, duration_ms):
+        self._remaining_ns = max(0, duration_ms) * NS_PER_MS
+        self._deadline_ns = self._clock() + self._remaining_ns
+
+    def pause(self):
+        """Freeze the remaining time; ignored once the deadline has passed.
+
+        An expired countdown stays running and ``expired()``, so the owner's
+        expiry handling still finishes it rather than it being stuck paused
+        at zero.
+        """
+        if self.running and not self.expired():
+            self._remaining_ns = self.remaining_ns()
+            self._deadline_ns = None
+
+    def resume(self):
+        if self.paused:
+            self._deadline_ns = self._clock() + self._remaining_ns
+
+    def reset(self):
+        self._deadline_ns = None
+        self._remaining_ns = 0
+
+    def remaining_ns(self):
+        deadline_ns = self._deadline_ns
+        if deadline_ns is None:
+            return self._remaining_ns
+        return max(0, deadline_ns - self._clock())
+
+    def remaining_ms(self):
+        return self.remaining_ns() // NS_PER_MS
+
+    def remaining_secs(self):
+        """Whole seconds to show: rounded up, so 0 is only shown at expiry."""
+        return -(-self.remaining_ns() // NS_PER_SEC)
+
+    def expired(self):
+        return self.running and self.remaining_ns() == 0
+
+    def ms_until_next_change(self):
+        """Milliseconds until the displayed second changes (or the deadline hits)."""
+        remaining = self.remaining_ns()
+        until = remaining % NS_PER_SEC or min(remaining, NS_PER_SEC)
+        return -(-until // NS_PER_MS)
@@ -0,0 +1,44 @@
+# laps.py
+# Recorded laps as cumulative totals, with split statistics kept up to date per lap
+from array import array
+
+from .lapstats import LapStatistics
+
+
+class LapRecorder:
+    """Lap totals in a flat array('q') of milliseconds.
+
+    Splits are derived from neighbouring totals rather than stored, and
+    LapStatistics is fed each split as it arrives, so recording a lap and
+    every query here stay cheap however many laps there are.
+    """
+
+    def __init__(self):
+        self.totals = array("q")
+        self.stats = LapStatistics()
+
+    def __len__(self):
+        return len(self.totals)
+
+    def split(self, row):
+        return self.totals[row] - (self.totals[row - 1] if row else 0)
+
+    def last_total(self):
+        return self.totals[-1] if self.totals else 0
+
+    def add(self, total_ms):
+        """Record a lap at ``total_ms`` elapsed and return its row."""
+        row = len(self.totals)
+        self.totals.append(total_ms)
+        self.stats.add(self.split(row), row)
+        return row
+
+    def load(self, totals):
+        """Replace all laps at once (used when restoring a session)."""
+        self.clear()
+        for total_ms in totals:
+            self.add(total_ms)
+
+    def clear(self):
+        del self.totals[:]  # In place, so existing references stay valid
+        self.stats.clear()
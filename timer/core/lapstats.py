@@ -0,0 +1,90 @@
+# lapstats.py
+# Running lap statistics, updated in O(log n) per lap without revisiting old laps
+import heapq
+from math import ceil, sqrt
+
+
+class RunningQuantile:
+    """Exact nearest-rank q-quantile of a growing sample.
+
+    The sample is split between a max-heap holding the lowest ceil(q * n)
+    values and a min-heap holding the rest, so the answer is always the top
+    of the low heap. Each insert moves at most one value across.
+    """
+
+    def __init__(self, q):
+        self.q = q
+        self._low = []   # Max-heap via negated values
+        self._high = []  # Min-heap
+
+    def __len__(self):
+        return len(self._low) + len(self._high)
+
+    def add(self, value):
+        if self._low and value > -self._low[0]:
+            heapq.heappush(self._high, value)
+        else:
+            heapq.heappush(self._low, -value)
+
+        target = max(1, ceil(self.q * len(self)))
+        while len(self._low) > target:
+            heapq.heappush(self._high, -heapq.heappop(self._low))
+        while len(self._low) < target:
+            heapq.heappush(self._low, -heapq.heappop(self._high))
+
+    def value(self):
+        return -self._low[0] if self._low else None
+
+    def clear(self):
+        self._low.clear()
+        self._high.clear()
+
+
+class LapStatistics:
+    """Best, worst, mean, standard deviation, median and p95 of lap splits.
+
+    Mean and variance use Welford's online algorithm; the quantiles use
+    RunningQuantile. Indexes of the best and worst laps are kept so the lap
+    view can highlight them.
+    """
+
+    def __init__(self):
+        self.median_q = RunningQuantile(0.5)
+        self.p95_q = RunningQuantile(0.95)
+        self.clear()
+
+    def clear(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.best = self.worst = None
+        self.best_index = self.worst_index = None
+        self.median_q.clear()
+        self.p95_q.clear()
+
+    def add(self, split_ms, index):
+        self.count += 1
+        delta = split_ms - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (split_ms - self.mean)
+
+        if self.best is None or split_ms < self.best:
+            self.best, self.best_index = split_ms, index
+        if self.worst is None or split_ms > self.worst:
+            self.worst, self.worst_index = split_ms, index
+
+        self.median_q.add(split_ms)
+        self.p95_q.add(split_ms)
+
+    @property
+    def stdev(self):
+        """Sample standard deviation (0 until there are two laps)."""
+        return sqrt(self._m2 / (self.count - 1)) if self.count > 1 else 0.0
+
+    @property
+    def median(self):
+        return self.median_q.value()
+
+    @property
+    def p95(self):
+        return self.p95_q.value()
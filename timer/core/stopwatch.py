@@ -0,0 +1,49 @@
+# stopwatch.py
+# Stopwatch timing in integer nanoseconds, read only when something needs the value
+import time
+
+from .clock import NS_PER_MS
+
+
+class StopwatchEngine:
+    """Elapsed time as an accumulated nanosecond count plus a running segment.
+
+    Nothing is added up per tick: the elapsed time is the clock reading minus
+    the segment start, so it is exact however rarely the display refreshes
+    and has no upper limit. ``clock`` returns monotonic nanoseconds; pass a
+    timestamp taken when an event happened to ``elapsed_ns(at)`` to measure
+    that instant rather than now.
+    """
+
+    def __init__(self, clock=time.monotonic_ns):
+        self._clock = clock
+        self._accumulated_ns = 0
+        self._started_ns = None  # Set only while running
+
+    @property
+    def running(self):
+        return self._started_ns is not None
+
+    def now(self):
+        return self._clock()
+
+    def start(self, at=None):
+        if not self.running:
+            self._started_ns = self._clock() if at is None else at
+
+    def pause(self, at=None):
+        if self.running:
+            self._accumulated_ns = self.elapsed_ns(at)
+            self._started_ns = None
+
+    def reset(self, accumulated_ns=0):
+        self._accumulated_ns = accumulated_ns
+        self._started_ns = None
+
+    def elapsed_ns(self, at=None):
+        if self._started_ns is None:
+            return self._accumulated_ns
+        return self._accumulated_ns + (self._clock() if at is None else at) - self._started_ns
+
+    def elapsed_ms(self, at=None):
+        return self.elapsed_ns(at) // NS_PER_MS
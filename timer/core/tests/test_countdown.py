@@ -0,0 +1,99 @@
+# test_countdown.py
+# CountdownEngine driven by a FakeClock: expiry, the next display change, pause and resume
+from core import CountdownEngine, FakeClock
+
+
+def make(duration_ms):
+    clock = FakeClock()
+    countdown = CountdownEngine(clock)
+    countdown.start(duration_ms)
+    return clock, countdown
+
+
+def test_expires_exactly_at_the_deadline():
+    clock, countdown = make(3000)
+    clock.advance(ms=2999)
+    assert not countdown.expired()
+    assert countdown.remaining_secs() == 1
+    clock.advance(ms=1)
+    assert countdown.expired()
+    assert countdown.remaining_secs() == 0
+    clock.advance(ms=5000)
+    assert countdown.remaining_ns() == 0  # Never goes negative
+
+
+def test_remaining_secs_rounds_up():
+    clock, countdown = make(1500)
+    assert countdown.remaining_secs() == 2
+    clock.advance(ms=600)
+    assert countdown.remaining_secs() == 1
+
+
+def test_ms_until_next_change():
+    clock, countdown = make(1500)
+    assert countdown.ms_until_next_change() == 500
+    clock.advance(ms=600)
+    assert countdown.ms_until_next_change() == 900
+    clock.advance(ms=900)
+    assert countdown.expired()
+
+
+def test_ms_until_next_change_on_a_whole_second():
+    clock, countdown = make(2000)
+    assert countdown.ms_until_next_change() == 1000
+    clock.advance(ns=1)
+    assert countdown.ms_until_next_change() == 1000  # Rounded up, never early
+
+
+def test_pause_freezes_and_resume_continues():
+    clock, countdown = make(10_000)
+    clock.advance(ms=4000)
+    countdown.pause()
+    assert countdown.paused and not countdown.running
+    clock.advance(ms=60_000)
+    assert countdown.remaining_ms() == 6000
+    assert not countdown.expired()
+
+    countdown.resume()
+    assert countdown.running
+    clock.advance(ms=5999)
+    assert countdown.remaining_ms() == 1
+    clock.advance(ms=1)
+    assert countdown.expired()
+
+
+def test_pause_on_the_deadline_leaves_it_expired():
+    clock, countdown = make(1000)
+    clock.advance(ms=1000)
+    countdown.pause()
+    assert countdown.running and countdown.expired()
+    countdown.resume()
+    assert countdown.expired()
+
+
+def test_pause_after_the_deadline_leaves_it_expired():
+    clock, countdown = make(1000)
+    clock.advance(ms=1500)  # The expiry tick is late
+    countdown.pause()
+    assert not countdown.paused
+    assert countdown.expired()
+    assert countdown.remaining_secs() == 0
+
+
+def test_pause_just_before_the_deadline():
+    clock, countdown = make(1000)
+    clock.advance(ns=1000 * 1_000_000 - 1)
+    countdown.pause()
+    assert countdown.paused and countdown.remaining_ns() == 1
+    countdown.resume()
+    assert countdown.ms_until_next_change() == 1
+    clock.advance(ns=1)
+    assert countdown.expired()
+
+
+def test_reset_clears_everything():
+    clock, countdown = make(5000)
+    countdown.pause()
+    countdown.reset()
+    assert not countdown.running and not countdown.paused
+    assert countdown.remaining_ns() == 0
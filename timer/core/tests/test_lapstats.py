@@ -0,0 +1,51 @@
+# test_lapstats.py
+# LapStatistics checked against statistics computed from scratch with sorted()
+import random
+import statistics
+from math import ceil
+
+from core import LapStatistics
+
+
+def nearest_rank(values, q):
+    ordered = sorted(values)
+    return ordered[max(1, ceil(q * len(ordered))) - 1]
+
+
+def test_quantiles_match_sorted_at_every_step():
+    rng = random.Random(1)
+    stats = LapStatistics()
+    splits = []
+    for index in range(500):
+        split = rng.randint(1, 5000)
+        splits.append(split)
+        stats.add(split, index)
+        assert stats.median == nearest_rank(splits, 0.5)
+        assert stats.p95 == nearest_rank(splits, 0.95)
+
+
+def test_quantiles_with_repeated_values():
+    stats = LapStatistics()
+    splits = [7, 7, 3, 7, 3, 3, 9, 1, 7]
+    for index, split in enumerate(splits):
+        stats.add(split, index)
+    assert stats.median == nearest_rank(splits, 0.5)
+    assert stats.p95 == nearest_rank(splits, 0.95)
+
+
+def test_mean_stdev_best_worst():
+    stats = LapStatistics()
+    splits = [1200, 900, 1500, 1100]
+    for index, split in enumerate(splits):
+        stats.add(split, index)
+    assert stats.mean == statistics.mean(splits)
+    assert abs(stats.stdev - statistics.stdev(splits)) < 1e-9
+    assert (stats.best, stats.best_index) == (900, 1)
+    assert (stats.worst, stats.worst_index) == (1500, 2)
+
+
+def test_clear():
+    stats = LapStatistics()
+    stats.add(10, 0)
+    stats.clear()
+    assert stats.count == 0 and stats.median is None and stats.p95 is None
@@ -0,0 +1,46 @@
+# test_stopwatch.py
+# StopwatchEngine driven by a FakeClock, including runs longer than a day
+from core import FakeClock, LapRecorder, StopwatchEngine
+
+DAY_MS = 24 * 60 * 60 * 1000
+
+
+def test_elapsed_past_24_hours():
+    clock = FakeClock()
+    stopwatch = StopwatchEngine(clock)
+    stopwatch.start()
+    clock.advance(ms=3 * DAY_MS + 5193)
+    assert stopwatch.elapsed_ms() == 3 * DAY_MS + 5193
+
+
+def test_pause_and_resume_skip_the_paused_time():
+    clock = FakeClock()
+    stopwatch = StopwatchEngine(clock)
+    stopwatch.start()
+    clock.advance(ms=1500)
+    stopwatch.pause()
+    clock.advance(ms=DAY_MS)
+    assert stopwatch.elapsed_ms() == 1500
+    stopwatch.start()
+    clock.advance(ms=250)
+    assert stopwatch.elapsed_ms() == 1750
+
+
+def test_elapsed_at_an_earlier_timestamp():
+    clock = FakeClock()
+    stopwatch = StopwatchEngine(clock)
+    stopwatch.start()
+    at = clock.advance(ms=100)
+    clock.advance(ms=40)
+    assert stopwatch.elapsed_ms(at) == 100
+    stopwatch.pause(at)
+    assert stopwatch.elapsed_ms() == 100
+
+
+def test_lap_splits_come_from_totals():
+    laps = LapRecorder()
+    for total in (1000, 2500, 2700):
+        laps.add(total)
+    assert [laps.split(row) for row in range(len(laps))] == [1000, 1500, 200]
+    assert laps.last_total() == 2700
+    assert laps.stats.best_index == 2 and laps.stats.worst_index == 1